@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Synthetic Benchmark Data
+
+Generators for the inputs of our hot paths at a multiple of today's size:
+stats CSVs shaped like public/stats/nba-stats.csv, and ESPN-shaped injury and
+news payloads. Scale 1 matches what we see today (about 210 stat lines, 120
+injuries across 30 teams and 20 news articles); run_benchmarks.py uses 1x,
+100x and 10,000x. Output is deterministic for a given scale and seed.
+
+Usage:
+    from benchmark_data import write_stats_csv, injuries_payload, news_payload
+
+    write_stats_csv('/tmp/stats_100x.csv', scale=100)
+    payload = injuries_payload(scale=100)   # dict, serialize with json.dumps
+"""
+import os
+import csv
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+
+STATS_CSV = os.path.join(os.path.dirname(__file__), '..', 'public', 'stats', 'nba-stats.csv')
+
+# Today's sizes, i.e. scale 1
+INJURIES_PER_TEAM = 4
+NEWS_ARTICLES = 20
+
+TEAMS = [
+    ('ATL', 'Atlanta Hawks'), ('BOS', 'Boston Celtics'), ('BKN', 'Brooklyn Nets'),
+    ('CHA', 'Charlotte Hornets'), ('CHI', 'Chicago Bulls'), ('CLE', 'Cleveland Cavaliers'),
+    ('DAL', 'Dallas Mavericks'), ('DEN', 'Denver Nuggets'), ('DET', 'Detroit Pistons'),
+    ('GS', 'Golden State Warriors'), ('HOU', 'Houston Rockets'), ('IND', 'Indiana Pacers'),
+    ('LAC', 'LA Clippers'), ('LAL', 'Los Angeles Lakers'), ('MEM', 'Memphis Grizzlies'),
+    ('MIA', 'Miami Heat'), ('MIL', 'Milwaukee Bucks'), ('MIN', 'Minnesota Timberwolves'),
+    ('NO', 'New Orleans Pelicans'), ('NY', 'New York Knicks'), ('OKC', 'Oklahoma City Thunder'),
+    ('ORL', 'Orlando Magic'), ('PHI', 'Philadelphia 76ers'), ('PHX', 'Phoenix Suns'),
+    ('POR', 'Portland Trail Blazers'), ('SAC', 'Sacramento Kings'), ('SA', 'San Antonio Spurs'),
+    ('TOR', 'Toronto Raptors'), ('UTAH', 'Utah Jazz'), ('WSH', 'Washington Wizards'),
+]
+
+FIRST_NAMES = ['Nikola', 'Luka', 'Jalen', 'Anthony', 'Tyrese', 'De\'Aaron', 'Karl-Anthony',
+               'Shai', 'Jaren', 'Domantas', 'Bogdan', 'Alperen', 'Scottie', 'Jusuf', 'Dennis']
+LAST_NAMES = ['Jokić', 'Dončić', 'Williams', 'Davis', 'Haliburton', 'Fox', 'Towns',
+              'Gilgeous-Alexander', 'Jackson Jr.', 'Sabonis', 'Bogdanović', 'Şengün',
+              'Barnes', 'Nurkić', 'Schröder']
+
+# (status, fantasy status) pairs in roughly the mix ESPN reports
+INJURY_STATUSES = [
+    ('Out', 'Out'), ('Out', None), ('Day-To-Day', 'Questionable'), ('Day-To-Day', 'Probable'),
+    ('Day-To-Day', 'Doubtful'), ('Out For Season', 'Out For Season'), ('Suspension', None),
+]
+INJURY_TYPES = [
+    ('Ankle', 'Left', 'Sprain'), ('Knee', 'Right', 'Soreness'), ('Hamstring', 'Left', 'Strain'),
+    ('Back', '', 'Spasms'), ('Illness', '', ''), ('Foot', 'Right', 'Fracture'), ('Rest', '', ''),
+]
+
+NUMERIC_JITTER = ('fpts_total', 'fpts', 'mp', 'fg', 'fga', 'ft', 'fta', 'trb', 'ast', 'stl', 'blk', 'tov', 'pts')
+
+
+def _player_name(rng: random.Random, i: int) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}"
+
+
+def stats_rows(scale: int = 1, seed: int = 0) -> Iterator[Dict[str, str]]:
+    """Rows of nba-stats.csv repeated `scale` times with unique player ids and jittered totals"""
+    rng = random.Random(seed)
+    with open(STATS_CSV, 'r', encoding='utf-8') as csvfile:
+        base = list(csv.DictReader(csvfile))
+
+    for copy in range(scale):
+        for row in base:
+            if copy == 0:
+                yield row
+                continue
+            row = dict(row)
+            row['player_id'] = f"{row['player_id'][:12]}{copy:07d}"
+            row['player'] = f"{row['player']} {copy}"
+            for column in NUMERIC_JITTER:
+                value = row.get(column)
+                if value and value != 'NA':
+                    number = float(value) * rng.uniform(0.9, 1.1)
+                    row[column] = str(int(number)) if '.' not in value else f"{number:.2f}"
+            yield row
+
+
+def write_stats_csv(path: str, scale: int = 1, seed: int = 0) -> int:
+    """Write a stats CSV at `scale` times today's size, returning the number of rows"""
+    with open(STATS_CSV, 'r', encoding='utf-8') as csvfile:
+        fieldnames = next(csv.reader(csvfile))
+
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in stats_rows(scale, seed):
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _injury(rng: random.Random, player_id: int, today: date) -> Dict[str, Any]:
+    status, fantasy_status = rng.choice(INJURY_STATUSES)
+    injury_type, location, detail = rng.choice(INJURY_TYPES)
+    name = _player_name(rng, player_id)
+
+    details: Dict[str, Any] = {'type': injury_type, 'location': location, 'detail': detail, 'side': location}
+    roll = rng.random()
+    if roll < 0.6:
+        details['returnDate'] = (today + timedelta(days=rng.randint(1, 60))).isoformat()
+    elif roll < 0.65:
+        details['returnDate'] = 'TBD'  # Unparseable dates do show up
+    if fantasy_status:
+        details['fantasyStatus'] = {'description': fantasy_status, 'abbreviation': fantasy_status[:3].upper()}
+
+    comment = f"{name} ({location} {injury_type.lower()}) is listed as {status.lower()}".replace('  ', ' ')
+    return {
+        'id': str(player_id + 500000),
+        'status': status,
+        'date': (today - timedelta(days=rng.randint(0, 20))).isoformat() + 'T18:00Z',
+        'athlete': {
+            'id': str(player_id),
+            'displayName': name,
+            'links': [{'href': f"https://www.espn.com/nba/player/_/id/{player_id}"}],
+        },
+        'type': {'id': '1', 'name': 'INJURY_STATUS_OUT', 'description': status.lower()},
+        'details': details,
+        'shortComment': comment + '.',
+        'longComment': comment + f" and will be re-evaluated in {rng.randint(1, 3)} weeks.",
+    }
+
+
+def injuries_payload(scale: int = 1, seed: int = 0, today: date = date(2025, 1, 15)) -> Dict[str, Any]:
+    """ESPN /injuries response with INJURIES_PER_TEAM * scale injuries for each of 30 teams"""
+    rng = random.Random(seed)
+    per_team = INJURIES_PER_TEAM * scale
+    teams = []
+    for t, (abbrev, name) in enumerate(TEAMS):
+        teams.append({
+            'id': str(t + 1),
+            'displayName': name,
+            'abbreviation': abbrev,
+            'injuries': [_injury(rng, 1000000 + t * per_team + i, today) for i in range(per_team)],
+        })
+    return {'timestamp': today.isoformat() + 'T12:00:00Z', 'status': 'success', 'injuries': teams}
+
+
+def news_payload(scale: int = 1, seed: int = 0, today: date = date(2025, 1, 15)) -> Dict[str, Any]:
+    """ESPN /news response with NEWS_ARTICLES * scale articles"""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(NEWS_ARTICLES * scale):
+        name = _player_name(rng, i)
+        abbrev, team = rng.choice(TEAMS)
+        headline = rng.choice([
+            f"{name} scores career-high as {team} roll",
+            f"{team} trade {name} in three-team deal",
+            f"{name} expected to miss time with {rng.choice(INJURY_TYPES)[0].lower()} injury",
+            f"{name} returns to {abbrev} starting lineup",
+        ])
+        articles.append({
+            'id': 40000000 + i,
+            'headline': headline,
+            'description': f"{headline}. " + ' '.join(rng.choice(LAST_NAMES) for _ in range(40)),
+            'published': (today - timedelta(minutes=7 * i)).isoformat() + 'T00:00:00Z',
+            'byline': rng.choice(['ESPN News Services', 'Adrian Wojnarowski', 'Shams Charania', None]),
+            'links': {'web': {'href': f"https://www.espn.com/nba/story/_/id/{40000000 + i}"}},
+            'categories': [{'type': 'athlete', 'description': name}, {'type': 'team', 'description': team}],
+        })
+    return {'header': 'NBA News', 'articles': articles}
+
+
+def injury_statuses(scale: int = 1, seed: int = 0) -> List[Tuple[str, str]]:
+    """(status, fantasy status) pairs as fed to severity classification, one per injury"""
+    rng = random.Random(seed)
+    return [rng.choice(INJURY_STATUSES) for _ in range(INJURIES_PER_TEAM * len(TEAMS) * scale)]
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Player Context Build Script
+
+This script materializes a compact JSON snapshot per player into the
+player_context table: season line, fantasy rank, current injury status and the
+latest three news summaries. The chat bot can then get everything it needs about
+a player with one indexed lookup instead of several queries per turn.
+
+Snapshots are rebuilt incrementally: only players whose stats line, news or
+injury status changed since the last build are recomputed and written.
+It should be run after import_nba_stats.py and after each fetch_nba_news.py run.
+Snapshots include news and injuries, so nothing is built until the news tables
+exist (see setup_news_fetch.sh).
+
+Usage:
+    python3 build_player_context.py
+    python3 build_player_context.py --full
+
+Environment Variables:
+    - DATABASE_URL (or NEON_DATABASE_URL): PostgreSQL connection string
+"""
+from dotenv import load_dotenv
+import os
+import sys
+import json
+import argparse
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List
+import psycopg2
+from psycopg2.extras import RealDictCursor, execute_values
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+LATEST_NEWS_COUNT = 3
+
+# Created by the news migrations (setup_news_fetch.sh), not by the stats import
+NEWS_DEPENDENCIES_SQL = """
+    SELECT to_regclass('nba_news') IS NOT NULL
+       AND to_regclass('player_injury_status') IS NOT NULL
+       AND to_regprocedure('nba_unaccent(text)') IS NOT NULL AS ready
+"""
+
+# Best stats row per player for the latest season (traded players have several
+# rows; the one with the most fantasy points is the full-season line), with ranks
+# and a hash of everything that ends up in the snapshot
+PLAYER_STATS_SQL = """
+    SELECT ranked.*,
+           md5(concat_ws('|', season, player, team, position, age, games, games_started,
+                         minutes_played, fpts_total, fpts, points, total_rebounds, assists,
+                         steals, blocks, turnovers, x3p_made, fg_percentage, ft_percentage,
+                         fantasy_rank, position_rank)) AS stats_hash
+    FROM (
+        SELECT best.*,
+               RANK() OVER (ORDER BY fpts_total DESC NULLS LAST) AS fantasy_rank,
+               RANK() OVER (PARTITION BY position ORDER BY fpts_total DESC NULLS LAST) AS position_rank
+        FROM (
+            SELECT DISTINCT ON (player_id) *, nba_unaccent(lower(player)) AS player_key
+            FROM nba_stats
+            WHERE season = (SELECT MAX(season) FROM nba_stats)
+            ORDER BY player_id, fpts_total DESC NULLS LAST
+        ) best
+    ) ranked
+"""
+
+NEWS_MARKER_SQL = """
+    SELECT nba_unaccent(lower(player_name)) AS player_key,
+           MAX(COALESCE(updated_at, created_at)) AS news_marker
+    FROM nba_news
+    WHERE player_name IS NOT NULL
+    GROUP BY 1
+"""
+
+INJURY_SQL = """
+    SELECT DISTINCT ON (nba_unaccent(lower(player_name)))
+           nba_unaccent(lower(player_name)) AS player_key,
+           status, expected_return_date, detail, severity, impact_level, comment, changed_at
+    FROM player_injury_status
+    ORDER BY nba_unaccent(lower(player_name)), changed_at DESC
+"""
+
+
+def per_game(total: Any, games: Any) -> Any:
+    """Per-game average rounded to one decimal, or None without games"""
+    if total is None or not games:
+        return None
+    return round(float(total) / games, 1)
+
+
+def json_default(value: Any) -> Any:
+    """Serialize values psycopg2 returns that json does not handle"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class PlayerContextBuilder:
+    """Builds and stores per-player context snapshots"""
+
+    def __init__(self, database_url: str):
+        self.database_url = database_url
+
+    def find_changed_players(self, cursor, full: bool = False) -> List[Dict[str, Any]]:
+        """Return stats rows plus markers for players whose snapshot is stale"""
+        cursor.execute(f"""
+            WITH stats AS ({PLAYER_STATS_SQL}),
+                 news AS ({NEWS_MARKER_SQL}),
+                 injury AS ({INJURY_SQL})
+            SELECT s.*, n.news_marker, i.changed_at AS injury_marker
+            FROM stats s
+            LEFT JOIN news n ON n.player_key = s.player_key
+            LEFT JOIN injury i ON i.player_key = s.player_key
+            LEFT JOIN player_context c ON c.player_id = s.player_id
+            WHERE %(full)s
+                OR c.player_id IS NULL
+                OR c.stats_hash <> s.stats_hash
+                OR c.news_marker IS DISTINCT FROM n.news_marker
+                OR c.injury_marker IS DISTINCT FROM i.changed_at
+        """, {'full': full})
+        return cursor.fetchall()
+
+    def fetch_injuries(self, cursor, player_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Current injury status for the given players, keyed by player_key"""
+        cursor.execute(f"""
+            SELECT * FROM ({INJURY_SQL}) injury
+            WHERE player_key = ANY(%s)
+        """, (player_keys,))
+        return {row['player_key']: row for row in cursor.fetchall()}
+
+    def fetch_latest_news(self, cursor, player_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Latest news summaries for the given players, keyed by player_key"""
+        cursor.execute("""
+            SELECT player_key, title, summary, category, impact_level, published_at
+            FROM (
+                SELECT nba_unaccent(lower(player_name)) AS player_key,
+                       title, summary, category, impact_level, published_at,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY nba_unaccent(lower(player_name))
+                           ORDER BY published_at DESC
+                       ) AS rn
+                FROM nba_news
+                WHERE nba_unaccent(lower(player_name)) = ANY(%s)
+            ) latest
+            WHERE rn <= %s
+            ORDER BY player_key, published_at DESC
+        """, (player_keys, LATEST_NEWS_COUNT))
+
+        news: Dict[str, List[Dict[str, Any]]] = {}
+        for row in cursor.fetchall():
+            news.setdefault(row.pop('player_key'), []).append(row)
+        return news
+
+    def build_context(self, stats: Dict[str, Any], injury: Dict[str, Any],
+                      news: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assemble the JSON snapshot for one player"""
+        games = stats.get('games')
+        return {
+            'player': stats['player'],
+            'player_id': stats['player_id'],
+            'team': stats.get('team'),
+            'position': stats.get('position'),
+            'age': stats.get('age'),
+            'season': {
+                'season': stats.get('season'),
+                'games': games,
+                'games_started': stats.get('games_started'),
+                'minutes': per_game(stats.get('minutes_played'), games),
+                'points': per_game(stats.get('points'), games),
+                'rebounds': per_game(stats.get('total_rebounds'), games),
+                'assists': per_game(stats.get('assists'), games),
+                'steals': per_game(stats.get('steals'), games),
+                'blocks': per_game(stats.get('blocks'), games),
+                'turnovers': per_game(stats.get('turnovers'), games),
+                'threes': per_game(stats.get('x3p_made'), games),
+                'fg_percentage': stats.get('fg_percentage'),
+                'ft_percentage': stats.get('ft_percentage'),
+                'fpts': stats.get('fpts'),
+                'fpts_total': stats.get('fpts_total'),
+            },
+            'fantasy_rank': stats.get('fantasy_rank'),
+            'position_rank': stats.get('position_rank'),
+            'injury': {
+                'status': injury.get('status'),
+                'expected_return_date': injury.get('expected_return_date'),
+                'detail': injury.get('detail'),
+                'severity': injury.get('severity'),
+                'impact_level': injury.get('impact_level'),
+                'comment': injury.get('comment'),
+                'changed_at': injury.get('changed_at'),
+            } if injury else None,
+            'latest_news': news,
+        }
+
+    def run(self, full: bool = False) -> int:
+        """Rebuild stale snapshots, returning the number of players rebuilt"""
+        conn = psycopg2.connect(self.database_url)
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+            cursor.execute(NEWS_DEPENDENCIES_SQL)
+            if not cursor.fetchone()['ready']:
+                logger.warning("News tables are not set up yet, skipping player context "
+                               "(run setup_news_fetch.sh to create them)")
+                return 0
+
+            changed = self.find_changed_players(cursor, full)
+            if changed:
+                player_keys = list({row['player_key'] for row in changed})
+                injuries = self.fetch_injuries(cursor, player_keys)
+                news = self.fetch_latest_news(cursor, player_keys)
+
+                execute_values(cursor, """
+                    INSERT INTO player_context (
+                        player_id, player, player_key, context,
+                        stats_hash, news_marker, injury_marker
+                    ) VALUES %s
+                    ON CONFLICT (player_id) DO UPDATE SET
+                        player = EXCLUDED.player,
+                        player_key = EXCLUDED.player_key,
+                        context = EXCLUDED.context,
+                        stats_hash = EXCLUDED.stats_hash,
+                        news_marker = EXCLUDED.news_marker,
+                        injury_marker = EXCLUDED.injury_marker,
+                        built_at = CURRENT_TIMESTAMP
+                """, [
+                    (
+                        row['player_id'],
+                        row['player'],
+                        row['player_key'],
+                        json.dumps(self.build_context(
+                            row,
+                            injuries.get(row['player_key']),
+                            news.get(row['player_key'], [])
+                        ), default=json_default),
+                        row['stats_hash'],
+                        row['news_marker'],
+                        row['injury_marker'],
+                    )
+                    for row in changed
+                ])
+
+            # Drop snapshots for players no longer in the latest stats
+            cursor.execute(f"""
+                DELETE FROM player_context
+                WHERE player_id NOT IN (SELECT player_id FROM ({PLAYER_STATS_SQL}) stats)
+            """)
+            removed_count = cursor.rowcount
+
+            conn.commit()
+            cursor.close()
+
+            logger.info(f"Rebuilt {len(changed)} player context snapshots, removed {removed_count}")
+            return len(changed)
+        finally:
+            conn.close()
+
+
+def main():
+    """Main function to rebuild stale player context snapshots"""
+    parser = argparse.ArgumentParser(description='Build per-player context snapshots')
+    parser.add_argument('--full', action='store_true', help='Rebuild every player, not just changed ones')
+    args = parser.parse_args()
+
+    database_url = os.getenv('DATABASE_URL') or os.getenv('NEON_DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL or NEON_DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    try:
+        PlayerContextBuilder(database_url).run(args.full)
+    except Exception as e:
+        logger.error(f"Error building player context: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+NBA News Embedding Script
+
+This script embeds nba_news rows into the nba_news_embeddings table so the chat
+bot can retrieve the most relevant news for a question by vector similarity
+(HNSW index, cosine distance) instead of guessing at SQL filters.
+
+Rows are embedded in large batches, and only when they are new or their text
+has changed since they were last embedded (compared by md5 content hash).
+It should be run after each fetch_nba_news.py run.
+
+Embedding backends:
+- openai: OpenAI text-embedding-ada-002 (same model as the chat app)
+- local: Deterministic feature-hashing model, no network access needed (for offline tests)
+
+Usage:
+    python3 embed_nba_news.py
+    python3 embed_nba_news.py --backend local
+    python3 embed_nba_news.py --query "who is out with a hamstring injury"
+
+Environment Variables:
+    - DATABASE_URL: PostgreSQL connection string
+    - OPENAI_API_KEY: OpenAI API key (openai backend only)
+"""
+from dotenv import load_dotenv
+import os
+import re
+import sys
+import math
+import hashlib
+import argparse
+import logging
+import unicodedata
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import RealDictCursor, execute_values
+from tenacity import retry, stop_after_attempt, wait_exponential
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMENSIONS = 1536
+
+# Text that gets embedded for each news row. The hash is computed in SQL so
+# unchanged rows are skipped without ever being transferred.
+EMBED_TEXT_SQL = "concat_ws(E'\\n', n.title, coalesce(n.content, n.summary), n.fantasy_impact_note)"
+
+
+class EmbeddingBackend(ABC):
+    """Base class for embedding backends"""
+
+    name = "base"
+    dimensions = EMBEDDING_DIMENSIONS
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Return one embedding per input text, in order"""
+
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """Embeds text with the OpenAI embeddings API"""
+
+    def __init__(self, model: str = "text-embedding-ada-002"):
+        import openai
+        self.name = model
+        self.client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        response = self.client.embeddings.create(model=self.name, input=texts)
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+
+class LocalHashingEmbeddingBackend(EmbeddingBackend):
+    """Deterministic bag-of-words model using signed feature hashing.
+
+    Produces the same vector for the same text on every machine, so it can be
+    used for offline tests and development without an API key.
+    """
+
+    name = "local-hashing-v1"
+
+    def _tokens(self, text: str) -> List[str]:
+        text = unicodedata.normalize('NFKD', text.lower())
+        text = ''.join(c for c in text if not unicodedata.combining(c))
+        words = re.findall(r"[a-z0-9]+", text)
+        # Unigrams plus bigrams keep some phrase information ("trade rumors")
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def _embed_one(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for token in self._tokens(text):
+            digest = hashlib.md5(token.encode('utf-8')).digest()
+            bucket = int.from_bytes(digest[:4], 'little') % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        return [v / norm for v in vector] if norm else vector
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+BACKENDS = {
+    'openai': OpenAIEmbeddingBackend,
+    'local': LocalHashingEmbeddingBackend,
+}
+
+
+def to_vector_literal(embedding: List[float]) -> str:
+    """Format an embedding as a pgvector literal"""
+    return '[' + ','.join(f"{v:.7g}" for v in embedding) + ']'
+
+
+class NewsEmbedder:
+    """Embeds nba_news rows and answers top-k similarity queries"""
+
+    def __init__(self, database_url: str, backend: EmbeddingBackend, batch_size: int = 256):
+        self.database_url = database_url
+        self.backend = backend
+        self.batch_size = batch_size
+
+    def _ensure_model_index(self, cursor):
+        """Create the partial HNSW index for this backend's model if it doesn't exist"""
+        index_name = 'idx_nba_news_embeddings_hnsw_' + re.sub(r'[^a-z0-9]+', '_', self.backend.name.lower()).strip('_')
+        cursor.execute(sql.SQL("""
+            CREATE INDEX IF NOT EXISTS {}
+            ON nba_news_embeddings USING hnsw (embedding vector_cosine_ops)
+            WHERE model = {}
+        """).format(sql.Identifier(index_name[:63]), sql.Literal(self.backend.name)))
+
+    def _fetch_pending(self, cursor, after_id: int) -> List[Dict[str, Any]]:
+        """Fetch the next batch of rows this backend's model has not embedded, or whose text changed"""
+        cursor.execute(f"""
+            SELECT n.id, {EMBED_TEXT_SQL} AS text, md5({EMBED_TEXT_SQL}) AS content_hash
+            FROM nba_news n
+            LEFT JOIN nba_news_embeddings e ON e.news_id = n.id AND e.model = %s
+            WHERE n.id > %s
+                AND (e.news_id IS NULL
+                     OR e.content_hash <> md5({EMBED_TEXT_SQL}))
+            ORDER BY n.id
+            LIMIT %s
+        """, (self.backend.name, after_id, self.batch_size))
+        return cursor.fetchall()
+
+    def embed_pending(self) -> int:
+        """Embed all pending rows in batches, returning the number embedded"""
+        embedded_count = 0
+        last_id = 0
+
+        conn = psycopg2.connect(self.database_url)
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            self._ensure_model_index(cursor)
+            conn.commit()
+
+            while True:
+                rows = self._fetch_pending(cursor, last_id)
+                if not rows:
+                    break
+                last_id = rows[-1]['id']
+
+                try:
+                    embeddings = self.backend.embed([row['text'] for row in rows])
+                except Exception as e:
+                    logger.error(f"Error embedding batch ending at id {last_id}: {e}")
+                    continue
+
+                execute_values(cursor, """
+                    INSERT INTO nba_news_embeddings (news_id, content_hash, model, embedding)
+                    VALUES %s
+                    ON CONFLICT (news_id, model) DO UPDATE SET
+                        content_hash = EXCLUDED.content_hash,
+                        embedding = EXCLUDED.embedding,
+                        embedded_at = CURRENT_TIMESTAMP
+                """, [
+                    (row['id'], row['content_hash'], self.backend.name, to_vector_literal(embedding))
+                    for row, embedding in zip(rows, embeddings)
+                ], template="(%s, %s, %s, %s::vector)")
+                conn.commit()
+
+                embedded_count += len(rows)
+                logger.info(f"Embedded {embedded_count} news items...")
+
+            cursor.close()
+        finally:
+            conn.close()
+
+        logger.info(f"Embedding completed: {embedded_count} news items embedded")
+        return embedded_count
+
+    def search(self, question: str, k: int = 5, ef_search: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return the k news items most similar to the question"""
+        query_vector = to_vector_literal(self.backend.embed([question])[0])
+
+        conn = psycopg2.connect(self.database_url)
+        try:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            # The scan returns at most ef_search rows (default 40), so never ask for fewer than k
+            cursor.execute("SET LOCAL hnsw.ef_search = %s", (max(ef_search or 40, k),))
+
+            cursor.execute("""
+                SELECT n.id, n.player_name, n.team, n.title, n.summary, n.category,
+                       n.impact_level, n.published_at, n.fantasy_impact_note,
+                       1 - (e.embedding <=> %s::vector) AS similarity
+                FROM nba_news_embeddings e
+                JOIN nba_news n ON n.id = e.news_id
+                WHERE e.model = %s
+                ORDER BY e.embedding <=> %s::vector
+                LIMIT %s
+            """, (query_vector, self.backend.name, query_vector, k))
+            results = cursor.fetchall()
+            cursor.close()
+            return results
+        finally:
+            conn.close()
+
+
+def main():
+    """Main function to embed pending news or run a similarity query"""
+    parser = argparse.ArgumentParser(description='Embed NBA news for semantic retrieval')
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='openai', help='Embedding backend')
+    parser.add_argument('--batch-size', type=int, default=256, help='Rows embedded per batch')
+    parser.add_argument('--query', help='Run a top-k similarity search instead of embedding')
+    parser.add_argument('-k', type=int, default=5, help='Number of results for --query')
+    args = parser.parse_args()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    if args.backend == 'openai' and not os.getenv('OPENAI_API_KEY'):
+        logger.error("OPENAI_API_KEY environment variable is required")
+        sys.exit(1)
+
+    try:
+        embedder = NewsEmbedder(database_url, BACKENDS[args.backend](), args.batch_size)
+
+        if args.query:
+            for item in embedder.search(args.query, args.k):
+                logger.info(f"{item['similarity']:.3f} {item['title']}")
+        else:
+            embedder.embed_pending()
+
+    except Exception as e:
+        logger.error(f"Error in embedding process: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ It should be run regularly (e.g., every hour) to keep the news data up to date.
 
 Usage:
     python3 fetch_nba_news.py
+    python3 fetch_nba_news.py --enqueue        # Leave enrichment to news_enrichment_worker.py
+    python3 fetch_nba_news.py --backfill --archive espn_news_2024.jsonl
+    python3 fetch_nba_news.py --backfill --since 2024-10-22 --concurrency 8
 
 Environment Variables:
     - DATABASE_URL: PostgreSQL connection string
@@ -23,15 +26,18 @@ import os
 import sys
 import asyncio
 import json
+import time
+import argparse
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import requests
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import Json, RealDictCursor, execute_values
 import openai
 from tenacity import retry, stop_after_attempt, wait_exponential
+from news_dedup import EntityMatcher, NearDuplicateIndex, load_player_names
 load_dotenv() # This loads the variables from .env into os.environ
 
 # Configure logging
@@ -67,6 +73,8 @@ class NewsItem:
     tags: List[str] = None
     affected_stats: List[str] = None
     fantasy_impact_note: Optional[str] = None
+    duplicate_of: Optional[int] = None
+    duplicate_similarity: Optional[float] = None
 
     def __post_init__(self):
         if self.tags is None:
@@ -96,23 +104,7 @@ class NBANewsFetcher:
             response.raise_for_status()
             
             data = response.json()
-            news_items = []
-            
-            for article in data.get('articles', []):
-                news_item = NewsItem(
-                    title=article.get('headline', ''),
-                    content=article.get('description', ''),
-                    source='espn',
-                    source_url=article.get('links', {}).get('web', {}).get('href'),
-                    author=article.get('byline'),
-                    published_at=article.get('published', ''),
-                )
-                
-                # Extract summary
-                if news_item.content:
-                    news_item.summary = news_item.content[:200] + '...' if len(news_item.content) > 200 else news_item.content
-                
-                news_items.append(news_item)
+            news_items = self.parse_espn_articles(data.get('articles', []))
             
             logger.info(f"Fetched {len(news_items)} items from ESPN")
             return news_items
@@ -121,6 +113,36 @@ class NBANewsFetcher:
             logger.error(f"Error fetching ESPN news: {e}")
             return []
     
+    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    def fetch_espn_news_page(self, page: int, limit: int = 50) -> List[NewsItem]:
+        """Fetch one page of the ESPN news feed, newest first (raises on errors)"""
+        url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/news"
+        response = self.session.get(url, params={'limit': limit, 'page': page}, timeout=30)
+        response.raise_for_status()
+        return self.parse_espn_articles(response.json().get('articles', []))
+    
+    def parse_espn_articles(self, articles: List[Dict]) -> List[NewsItem]:
+        """Convert ESPN article objects into news items"""
+        news_items = []
+        
+        for article in articles:
+            news_item = NewsItem(
+                title=article.get('headline', ''),
+                content=article.get('description', ''),
+                source='espn',
+                source_url=article.get('links', {}).get('web', {}).get('href'),
+                author=article.get('byline'),
+                published_at=article.get('published', ''),
+            )
+            
+            # Extract summary
+            if news_item.content:
+                news_item.summary = news_item.content[:200] + '...' if len(news_item.content) > 200 else news_item.content
+            
+            news_items.append(news_item)
+        
+        return news_items
+    
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def fetch_espn_injuries(self) -> List[NewsItem]:
         """Fetch NBA injury data from ESPN API"""
@@ -193,24 +215,7 @@ class NBANewsFetcher:
                     )
                     
                     # Determine severity based on status and fantasy status
-                    status_lower = status.lower() if status else ''
-                    fantasy_status_lower = fantasy_status.lower() if fantasy_status else ''
-                    
-                    if 'day-to-day' in status_lower or 'dtd' in status_lower or 'questionable' in fantasy_status_lower:
-                        news_item.severity = 'minor'
-                        news_item.impact_level = 'low'
-                    elif 'out' in status_lower or 'out' in fantasy_status_lower:
-                        news_item.severity = 'moderate'
-                        news_item.impact_level = 'high'
-                    elif 'season' in status_lower or 'season' in fantasy_status_lower:
-                        news_item.severity = 'season_ending'
-                        news_item.impact_level = 'critical'
-                    elif 'doubtful' in fantasy_status_lower:
-                        news_item.severity = 'moderate'
-                        news_item.impact_level = 'high'
-                    else:
-                        news_item.severity = 'minor'
-                        news_item.impact_level = 'medium'
+                    news_item.severity, news_item.impact_level = self.classify_injury_severity(status, fantasy_status)
                     
                     # Set expected return date if available
                     if return_date:
@@ -237,6 +242,22 @@ class NBANewsFetcher:
             logger.error(f"Error fetching ESPN injury data: {e}")
             return []
     
+    def classify_injury_severity(self, status: Optional[str], fantasy_status: Optional[str] = None) -> tuple:
+        """Map an ESPN injury status to (severity, impact_level)"""
+        status_lower = status.lower() if status else ''
+        fantasy_status_lower = fantasy_status.lower() if fantasy_status else ''
+        
+        if 'day-to-day' in status_lower or 'dtd' in status_lower or 'questionable' in fantasy_status_lower:
+            return 'minor', 'low'
+        elif 'out' in status_lower or 'out' in fantasy_status_lower:
+            return 'moderate', 'high'
+        elif 'season' in status_lower or 'season' in fantasy_status_lower:
+            return 'season_ending', 'critical'
+        elif 'doubtful' in fantasy_status_lower:
+            return 'moderate', 'high'
+        else:
+            return 'minor', 'medium'
+    
     def _generate_injury_fantasy_note(self, player_name: str, status: str, injury_type: str, 
                                     injury_detail: str, return_date: str = None) -> str:
         """Generate a fantasy impact note for injury"""
@@ -351,6 +372,10 @@ class NBANewsFetcher:
             result = json.loads(response_content)
             return result
             
+        except openai.APIError:
+            # Callers that must not store unenriched items (backfill, queue workers)
+            # retry on API errors such as rate limits instead
+            raise
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error extracting player info for '{title[:50]}...': {e}")
             logger.error(f"Response content: {response.choices[0].message.content}")
@@ -431,6 +456,8 @@ class NBANewsFetcher:
             
             return news_item
             
+        except openai.APIError:
+            raise
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error categorizing news for '{news_item.title[:50]}...': {e}")
             logger.error(f"Response content: {response.choices[0].message.content}")
@@ -439,8 +466,47 @@ class NBANewsFetcher:
             logger.error(f"Error categorizing news: {e}")
             return news_item
     
-    async def fetch_all_news(self) -> List[NewsItem]:
-        """Fetch news from all sources"""
+    def match_duplicate(self, dedup_index: NearDuplicateIndex, news_item: NewsItem, batch_key: tuple) -> str:
+        """Check a news item against the near-duplicate index
+
+        Returns 'duplicate' (duplicate_of is set to the stored article), 'drop'
+        (near-duplicate of another article in this run) or 'new' (indexed under
+        batch_key so later duplicates in this run are dropped). batch_key must
+        be unique among the batch entries in the index and not an int.
+        """
+        signature = dedup_index.signature(news_item.title, news_item.content)
+        match = dedup_index.find_duplicate(news_item.title, news_item.content, signature)
+        if match:
+            canonical, similarity = match
+            if isinstance(canonical, int):
+                news_item.duplicate_of = canonical
+                news_item.duplicate_similarity = similarity
+                return 'duplicate'
+            logger.debug(f"Dropping in-batch duplicate: {news_item.title[:50]}...")
+            return 'drop'
+        # Batch articles get a non-int key so later duplicates in this run are dropped
+        dedup_index.add(batch_key, news_item.title, news_item.content, signature)
+        return 'new'
+    
+    def enrich_news_item(self, news_item: NewsItem) -> NewsItem:
+        """Extract the player and categorize a news item using AI"""
+        player_info = self.extract_player_info(news_item.title, news_item.content)
+        if player_info.get('found'):
+            news_item.player_name = player_info.get('player_name')
+            news_item.player_id = player_info.get('player_id')
+            news_item.team = player_info.get('team')
+        
+        return self.categorize_and_analyze_news(news_item)
+    
+    async def fetch_all_news(self, dedup_index: Optional[NearDuplicateIndex] = None,
+                             enrich: bool = True) -> List[NewsItem]:
+        """Fetch news from all sources
+
+        If dedup_index is given, articles that are near-duplicates of an indexed
+        nba_news row are not enriched and come back with duplicate_of set.
+        Near-duplicates of another article in the same batch are dropped.
+        With enrich=False articles come back raw, for enrichment workers.
+        """
         logger.info("Starting to fetch NBA news from all sources...")
         
         # Fetch from multiple sources concurrently
@@ -452,7 +518,7 @@ class NBANewsFetcher:
         
         # Process each news item
         processed_news = []
-        for news_item in all_news:
+        for i, news_item in enumerate(all_news):
             try:
                 # Skip AI processing for injury data since it's already well-structured
                 if news_item.source == 'espn_injuries':
@@ -460,15 +526,16 @@ class NBANewsFetcher:
                     processed_news.append(news_item)
                     continue
                 
-                # Extract player information for other news sources
-                player_info = self.extract_player_info(news_item.title, news_item.content)
-                if player_info.get('found'):
-                    news_item.player_name = player_info.get('player_name')
-                    news_item.player_id = player_info.get('player_id')
-                    news_item.team = player_info.get('team')
+                # Check for near-duplicates before spending on AI enrichment
+                if dedup_index is not None:
+                    match = self.match_duplicate(dedup_index, news_item, ('batch', i))
+                    if match == 'duplicate':
+                        processed_news.append(news_item)
+                    if match != 'new':
+                        continue
                 
-                # Categorize and analyze
-                processed_news.append(self.categorize_and_analyze_news(news_item))
+                # Extract player information and categorize other news sources
+                processed_news.append(self.enrich_news_item(news_item) if enrich else news_item)
                 
             except Exception as e:
                 logger.error(f"Error processing news item '{news_item.title}': {e}")
@@ -480,9 +547,44 @@ class NBANewsFetcher:
 class DatabaseManager:
     """Manages database operations for NBA news"""
     
+    INSERT_NEWS_QUERY = """
+        INSERT INTO nba_news (
+            player_name, player_id, team, title, content, summary,
+            category, severity, impact_level, status, expected_return_date,
+            games_missed, source, source_url, author, published_at,
+            tags, affected_stats, fantasy_impact_note
+        ) VALUES (
+            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+        )
+    """
+    
     def __init__(self, database_url: str):
         self.database_url = database_url
     
+    def _news_item_row(self, news_item: NewsItem) -> tuple:
+        """Values for INSERT_NEWS_QUERY"""
+        return (
+            news_item.player_name,
+            news_item.player_id,
+            news_item.team,
+            news_item.title,
+            news_item.content,
+            news_item.summary,
+            news_item.category,
+            news_item.severity,
+            news_item.impact_level,
+            news_item.status,
+            news_item.expected_return_date,
+            news_item.games_missed,
+            news_item.source,
+            news_item.source_url,
+            news_item.author,
+            news_item.published_at,
+            news_item.tags,
+            news_item.affected_stats,
+            news_item.fantasy_impact_note
+        )
+    
     def save_news_item(self, news_item: NewsItem) -> bool:
         """Save a news item to the database"""
         try:
@@ -502,51 +604,347 @@ class DatabaseManager:
                 logger.debug(f"Article already exists: {news_item.title[:50]}...")
                 return False
             
+            cursor.execute(self.INSERT_NEWS_QUERY + " RETURNING id", self._news_item_row(news_item))
+            
+            result = cursor.fetchone()
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            return result is not None
+            
+        except Exception as e:
+            logger.error(f"Error saving news item to database: {e}")
+            return False
+    
+    def upsert_injury_status(self, news_item: NewsItem) -> Optional[bool]:
+        """Upsert a player's current injury state
+
+        Returns True if it changed, False if the report matched the stored
+        state, or None if the upsert failed.
+        """
+        try:
+            conn = psycopg2.connect(self.database_url)
+            cursor = conn.cursor()
+            
+            # The WHERE clause turns unchanged reports into no-ops, so the
+            # history trigger and NOTIFY only fire on real transitions
             query = """
-                INSERT INTO nba_news (
-                    player_name, player_id, team, title, content, summary,
-                    category, severity, impact_level, status, expected_return_date,
-                    games_missed, source, source_url, author, published_at,
-                    tags, affected_stats, fantasy_impact_note
+                INSERT INTO player_injury_status (
+                    player_id, player_name, team, status, expected_return_date, detail,
+                    severity, impact_level, comment, fantasy_impact_note,
+                    source, source_url, reported_at
                 ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                 )
-                RETURNING id
+                ON CONFLICT (player_id) DO UPDATE SET
+                    player_name = EXCLUDED.player_name,
+                    team = EXCLUDED.team,
+                    status = EXCLUDED.status,
+                    expected_return_date = EXCLUDED.expected_return_date,
+                    detail = EXCLUDED.detail,
+                    severity = EXCLUDED.severity,
+                    impact_level = EXCLUDED.impact_level,
+                    comment = EXCLUDED.comment,
+                    fantasy_impact_note = EXCLUDED.fantasy_impact_note,
+                    source = EXCLUDED.source,
+                    source_url = EXCLUDED.source_url,
+                    reported_at = EXCLUDED.reported_at,
+                    changed_at = CURRENT_TIMESTAMP
+                WHERE player_injury_status.status IS DISTINCT FROM EXCLUDED.status
+                    OR player_injury_status.expected_return_date IS DISTINCT FROM EXCLUDED.expected_return_date
+                    OR player_injury_status.detail IS DISTINCT FROM EXCLUDED.detail
+                RETURNING player_id
             """
             
             cursor.execute(query, (
-                news_item.player_name,
                 news_item.player_id,
+                news_item.player_name,
                 news_item.team,
-                news_item.title,
-                news_item.content,
-                news_item.summary,
-                news_item.category,
-                news_item.severity,
-                news_item.impact_level,
                 news_item.status,
                 news_item.expected_return_date,
-                news_item.games_missed,
+                ', '.join(news_item.tags) or None,
+                news_item.severity,
+                news_item.impact_level,
+                news_item.summary,
+                news_item.fantasy_impact_note,
                 news_item.source,
                 news_item.source_url,
-                news_item.author,
-                news_item.published_at,
-                news_item.tags,
-                news_item.affected_stats,
-                news_item.fantasy_impact_note
+                news_item.published_at or None
             ))
             
-            result = cursor.fetchone()
+            changed = cursor.fetchone() is not None
             conn.commit()
             cursor.close()
             conn.close()
             
-            return result is not None
+            if changed:
+                logger.info(f"Injury status changed for {news_item.player_name}: {news_item.status}")
+            return changed
             
         except Exception as e:
-            logger.error(f"Error saving news item to database: {e}")
+            logger.error(f"Error upserting injury status for {news_item.player_name}: {e}")
+            return None
+    
+    def clear_recovered_injuries(self, reported_player_ids: List[str]):
+        """Mark players missing from the latest injury report as healthy"""
+        try:
+            conn = psycopg2.connect(self.database_url)
+            cursor = conn.cursor()
+            
+            query = """
+                UPDATE player_injury_status
+                SET status = 'healthy',
+                    expected_return_date = NULL,
+                    detail = NULL,
+                    severity = NULL,
+                    impact_level = NULL,
+                    comment = NULL,
+                    fantasy_impact_note = NULL,
+                    changed_at = CURRENT_TIMESTAMP
+                WHERE status IS DISTINCT FROM 'healthy'
+                    AND NOT (player_id = ANY(%s))
+            """
+            
+            cursor.execute(query, (reported_player_ids,))
+            cleared_count = cursor.rowcount
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            logger.info(f"Cleared {cleared_count} players no longer on the injury report")
+            
+        except Exception as e:
+            logger.error(f"Error clearing recovered injuries: {e}")
+    
+    def build_dedup_index(self, days: int = 30, include_queued: bool = False) -> Optional[NearDuplicateIndex]:
+        """Build a near-duplicate index over recent news articles
+
+        With include_queued, articles still waiting in news_enrichment_jobs are
+        indexed too. They have no nba_news row to link to yet, so near-duplicates
+        of them are dropped instead of recorded in nba_news_duplicates.
+        """
+        try:
+            conn = psycopg2.connect(self.database_url)
+            cursor = conn.cursor()
+            
+            query = """
+                SELECT id, title, content FROM nba_news
+                WHERE source <> 'espn_injuries'
+                    AND published_at >= CURRENT_DATE - INTERVAL '%s days'
+            """
+            
+            # Templated stories about different players must not be linked
+            entity_matcher = EntityMatcher(load_player_names(cursor))
+            cursor.execute(query, (days,))
+            dedup_index = NearDuplicateIndex(entity_matcher=entity_matcher)
+            for news_id, title, content in cursor.fetchall():
+                dedup_index.add(news_id, title, content)
+            
+            if include_queued:
+                cursor.execute("""
+                    SELECT id, title, payload->>'content' FROM news_enrichment_jobs
+                    WHERE status IN ('pending', 'running')
+                        AND published_at >= CURRENT_DATE - INTERVAL '%s days'
+                """, (days,))
+                # Non-int keys, like in-batch articles, so matches are dropped
+                for job_id, title, content in cursor.fetchall():
+                    dedup_index.add(('job', job_id), title, content)
+            
+            cursor.close()
+            conn.close()
+            
+            logger.info(f"Indexed {len(dedup_index)} recent articles for near-duplicate detection")
+            return dedup_index
+            
+        except Exception as e:
+            logger.error(f"Error building near-duplicate index: {e}")
+            return None
+    
+    def save_duplicate_link(self, news_item: NewsItem) -> bool:
+        """Link a near-duplicate article to its canonical nba_news row"""
+        try:
+            conn = psycopg2.connect(self.database_url)
+            cursor = conn.cursor()
+            
+            result = self._insert_duplicate_link(cursor, news_item)
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            if result:
+                logger.info(f"Linked near-duplicate '{news_item.title[:50]}...' to #{news_item.duplicate_of}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error saving duplicate link: {e}")
             return False
     
+    def _insert_duplicate_link(self, cursor, news_item: NewsItem) -> bool:
+        """Insert a nba_news_duplicates row on an open cursor"""
+        # Re-fetching the canonical article itself is not a new duplicate
+        query = """
+            INSERT INTO nba_news_duplicates (
+                canonical_id, title, source, source_url, published_at, similarity
+            )
+            SELECT %s, %s, %s, %s, %s, %s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM nba_news
+                WHERE id = %s AND title = %s AND published_at = %s
+            )
+            ON CONFLICT (canonical_id, title, published_at) DO NOTHING
+            RETURNING id
+        """
+        
+        cursor.execute(query, (
+            news_item.duplicate_of,
+            news_item.title,
+            news_item.source,
+            news_item.source_url,
+            news_item.published_at,
+            news_item.duplicate_similarity,
+            news_item.duplicate_of,
+            news_item.title,
+            news_item.published_at
+        ))
+        return cursor.fetchone() is not None
+    
+    def get_backfill_checkpoint(self, name: str) -> Optional[Dict]:
+        """Last committed position of a backfill, or None if it never ran"""
+        conn = psycopg2.connect(self.database_url)
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        
+        cursor.execute("SELECT * FROM nba_news_backfill_checkpoints WHERE name = %s", (name,))
+        checkpoint = cursor.fetchone()
+        
+        cursor.close()
+        conn.close()
+        return dict(checkpoint) if checkpoint else None
+    
+    def reset_backfill_checkpoint(self, name: str):
+        """Forget a backfill's progress so it starts over"""
+        conn = psycopg2.connect(self.database_url)
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM nba_news_backfill_checkpoints WHERE name = %s", (name,))
+        conn.commit()
+        cursor.close()
+        conn.close()
+    
+    def find_existing_articles(self, news_items: List[NewsItem]) -> set:
+        """Indexes of news items already stored in nba_news (same title and published_at)"""
+        if not news_items:
+            return set()
+        
+        conn = psycopg2.connect(self.database_url)
+        cursor = conn.cursor()
+        
+        query = """
+            SELECT v.i - 1
+            FROM unnest(%s::text[], %s::text[]) WITH ORDINALITY AS v(title, published_at, i)
+            JOIN nba_news n ON n.title = v.title AND n.published_at = v.published_at::timestamp
+        """
+        
+        cursor.execute(query, (
+            [news_item.title for news_item in news_items],
+            [news_item.published_at for news_item in news_items]
+        ))
+        existing = {row[0] for row in cursor.fetchall()}
+        
+        cursor.close()
+        conn.close()
+        return existing
+    
+    def save_backfill_batch(self, news_items: List[NewsItem], checkpoint: Dict) -> Optional[List[tuple]]:
+        """Save a batch of backfilled news and advance its checkpoint in one transaction
+
+        Returns [(news_id, news_item), ...] for the articles inserted, or None if
+        nothing was committed (the checkpoint then still points at this batch).
+        """
+        try:
+            conn = psycopg2.connect(self.database_url)
+            cursor = conn.cursor()
+            
+            saved = []
+            for news_item in news_items:
+                if news_item.duplicate_of:
+                    self._insert_duplicate_link(cursor, news_item)
+                    continue
+                
+                cursor.execute(
+                    self.INSERT_NEWS_QUERY + " ON CONFLICT (title, published_at) DO NOTHING RETURNING id",
+                    self._news_item_row(news_item)
+                )
+                result = cursor.fetchone()
+                if result:
+                    saved.append((result[0], news_item))
+            
+            cursor.execute("""
+                INSERT INTO nba_news_backfill_checkpoints (
+                    name, position, items_seen, items_saved, completed, updated_at
+                ) VALUES (
+                    %(name)s, %(position)s, %(items_seen)s, %(items_saved)s + %(batch_saved)s, %(completed)s, CURRENT_TIMESTAMP
+                )
+                ON CONFLICT (name) DO UPDATE SET
+                    position = EXCLUDED.position,
+                    items_seen = EXCLUDED.items_seen,
+                    items_saved = EXCLUDED.items_saved,
+                    completed = EXCLUDED.completed,
+                    updated_at = CURRENT_TIMESTAMP
+            """, dict(checkpoint, batch_saved=len(saved)))
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            checkpoint['items_saved'] += len(saved)
+            return saved
+            
+        except Exception as e:
+            logger.error(f"Error saving backfill batch: {e}")
+            return None
+    
+    def enqueue_news_items(self, news_items: List[NewsItem]) -> int:
+        """Queue raw articles for enrichment workers, skipping ones already stored or queued"""
+        # Articles without a publish time cannot be stored, and one would fail the whole batch
+        dated = [news_item for news_item in news_items if news_item.title and news_item.published_at]
+        if len(dated) < len(news_items):
+            logger.warning(f"Not queueing {len(news_items) - len(dated)} articles without a title or publish time")
+        news_items = dated
+        if not news_items:
+            return 0
+        try:
+            conn = psycopg2.connect(self.database_url)
+            cursor = conn.cursor()
+            
+            query = """
+                INSERT INTO news_enrichment_jobs (title, published_at, payload)
+                SELECT v.title, v.published_at::timestamp, v.payload::jsonb
+                FROM (VALUES %s) AS v(title, published_at, payload)
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM nba_news n
+                    WHERE n.title = v.title AND n.published_at = v.published_at::timestamp
+                )
+                ON CONFLICT (title, published_at) DO NOTHING
+                RETURNING id
+            """
+            
+            queued = execute_values(cursor, query, [
+                (news_item.title, news_item.published_at, Json(asdict(news_item)))
+                for news_item in news_items
+            ], fetch=True)
+            
+            conn.commit()
+            cursor.close()
+            conn.close()
+            
+            logger.info(f"Queued {len(queued)} articles for enrichment")
+            return len(queued)
+            
+        except Exception as e:
+            logger.error(f"Error queueing news for enrichment: {e}")
+            return 0
+    
     def cleanup_old_news(self, days: int = 30):
         """Remove news older than specified days"""
         try:
@@ -570,8 +968,231 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error cleaning up old news: {e}")
 
+class NewsBackfill:
+    """Seeds historical news in checkpointed batches
+
+    Each batch is deduplicated against stored news, enriched with at most
+    `concurrency` OpenAI requests in flight, and committed together with the
+    checkpoint, so a stopped run resumes after the last committed batch
+    without fetching or enriching anything twice.
+    """
+    
+    def __init__(self, fetcher: NBANewsFetcher, db_manager: DatabaseManager,
+                 batch_size: int = 50, concurrency: int = 4):
+        self.fetcher = fetcher
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+    
+    def parse_published(self, published_at: str) -> Optional[datetime]:
+        """Parse an ESPN timestamp like 2025-01-15T18:30:00Z as naive UTC"""
+        try:
+            return datetime.fromisoformat(published_at.replace('Z', '+00:00')).replace(tzinfo=None)
+        except (AttributeError, ValueError):
+            return None
+    
+    def archive_batches(self, path: str, position: int):
+        """Yield (news_items, next_position, fraction_done) from a JSON Lines file of ESPN
+        article objects; positions are byte offsets so a resume seeks straight to them"""
+        total = os.path.getsize(path)
+        with open(path, 'rb') as archive:
+            archive.seek(position)
+            while True:
+                articles = []
+                while len(articles) < self.batch_size:
+                    line = archive.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    try:
+                        articles.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping malformed archive line ending at byte {archive.tell()}: {e}")
+                
+                if not articles:
+                    return
+                yield self.fetcher.parse_espn_articles(articles), archive.tell(), archive.tell() / total
+    
+    def feed_batches(self, since: datetime, page: int):
+        """Yield (news_items, next_page, fraction_done) paging back through the ESPN feed
+        until articles are older than `since`"""
+        page = max(page, 1)  # ESPN pages are 1-based
+        newest = None
+        previous_titles = set()
+        while True:
+            news_items = self.fetcher.fetch_espn_news_page(page, self.batch_size)
+            titles = {news_item.title for news_item in news_items}
+            if titles and titles <= previous_titles:
+                logger.warning(f"ESPN returned page {page - 1} again; the feed does not page back further")
+                return
+            previous_titles = titles
+            
+            published = [p for p in (self.parse_published(n.published_at) for n in news_items) if p]
+            in_range = [
+                news_item for news_item in news_items
+                if (self.parse_published(news_item.published_at) or since) >= since
+            ]
+            if not published or len(in_range) < len(news_items):
+                yield in_range, page + 1, 1.0
+                return
+            
+            newest = newest or max(published)
+            span = (newest - since).total_seconds()
+            yield in_range, page + 1, (newest - min(published)).total_seconds() / span if span > 0 else 1.0
+            page += 1
+    
+    async def enrich(self, news_items: List[NewsItem]) -> tuple:
+        """Enrich news items in parallel with bounded concurrency
+
+        Returns (enriched items, openai.APIError or None); items whose OpenAI
+        requests failed (rate limits, connection errors, 5xx) are left out so
+        they are never stored unenriched. A rate limit is reported in
+        preference to other API errors.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def enrich_one(news_item: NewsItem) -> NewsItem:
+            async with semaphore:
+                return await asyncio.to_thread(self.fetcher.enrich_news_item, news_item)
+        
+        results = await asyncio.gather(*(enrich_one(n) for n in news_items), return_exceptions=True)
+        
+        enriched = []
+        api_error = None
+        for news_item, result in zip(news_items, results):
+            if isinstance(result, openai.APIError):
+                if api_error is None or isinstance(result, openai.RateLimitError):
+                    api_error = result
+                continue
+            if isinstance(result, Exception):
+                logger.error(f"Error processing news item '{news_item.title}': {result}")
+                result = news_item
+            enriched.append(result)
+        return enriched, api_error
+    
+    async def run(self, name: str, batches, restart: bool = False, dedup_days: int = 365) -> bool:
+        """Run a backfill from its checkpoint; batches(position) yields
+        (news_items, next_position, fraction_done)"""
+        try:
+            if restart:
+                self.db_manager.reset_backfill_checkpoint(name)
+            checkpoint = self.db_manager.get_backfill_checkpoint(name) or {
+                'name': name, 'position': 0, 'items_seen': 0, 'items_saved': 0, 'completed': False
+            }
+        except Exception as e:
+            logger.error(f"Error reading backfill checkpoint {name}: {e}")
+            return False
+        
+        if checkpoint['completed']:
+            logger.info(f"Backfill {name} already completed; use --restart to run it again")
+            return True
+        if checkpoint['position']:
+            logger.info(f"Resuming backfill {name} at position {checkpoint['position']} "
+                        f"({checkpoint['items_seen']} articles seen, {checkpoint['items_saved']} saved)")
+        
+        dedup_index = self.db_manager.build_dedup_index(dedup_days)
+        started = time.monotonic()
+        first_fraction = None
+        seen_this_run = 0
+        
+        try:
+            for news_items, position, fraction in batches(checkpoint['position']):
+                # Articles without a title or a parseable publish time cannot be stored
+                # (or looked up), so they are skipped instead of failing the batch
+                valid = [
+                    news_item for news_item in news_items
+                    if news_item.title and self.parse_published(news_item.published_at)
+                ]
+                if len(valid) < len(news_items):
+                    logger.warning(f"Skipping {len(news_items) - len(valid)} articles without a title or publish time")
+                existing = self.db_manager.find_existing_articles(valid)
+                
+                to_save = []
+                to_enrich = []
+                batch_keys = []
+                for i, news_item in enumerate(valid):
+                    if i in existing:
+                        continue
+                    match = 'new'
+                    if dedup_index is not None:
+                        match = self.fetcher.match_duplicate(dedup_index, news_item, ('batch', i))
+                    if match == 'duplicate':
+                        to_save.append(news_item)
+                    elif match == 'new':
+                        to_enrich.append(news_item)
+                        batch_keys.append(('batch', i))
+                
+                enriched, api_error = await self.enrich(to_enrich)
+                to_save += enriched
+                if api_error:
+                    # Keep what was enriched without advancing the checkpoint; the retried
+                    # batch skips these articles as already stored
+                    self.db_manager.save_backfill_batch(to_save, checkpoint)
+                    raise api_error
+                
+                checkpoint.update(position=position, items_seen=checkpoint['items_seen'] + len(news_items))
+                saved = self.db_manager.save_backfill_batch(to_save, checkpoint)
+                if saved is None:
+                    logger.error("Backfill stopped; re-run to resume from the last checkpoint")
+                    return False
+                if dedup_index is not None:
+                    # Saved articles are re-indexed under their nba_news id, so later
+                    # near-duplicates are linked to them instead of dropped
+                    for key in batch_keys:
+                        dedup_index.remove(key)
+                    for news_id, news_item in saved:
+                        dedup_index.add(news_id, news_item.title, news_item.content)
+                
+                seen_this_run += len(news_items)
+                elapsed = time.monotonic() - started
+                eta = ''
+                if first_fraction is None:
+                    first_fraction, first_elapsed = fraction, elapsed
+                elif fraction > first_fraction:
+                    remaining = (elapsed - first_elapsed) / (fraction - first_fraction) * (1 - fraction)
+                    eta = f", ETA {timedelta(seconds=int(remaining))}"
+                logger.info(
+                    f"Backfill {name}: {checkpoint['items_seen']} articles seen, {checkpoint['items_saved']} saved, "
+                    f"{fraction:.1%} done, {seen_this_run / elapsed:.1f} articles/s{eta}"
+                )
+            
+            checkpoint['completed'] = True
+            if self.db_manager.save_backfill_batch([], checkpoint) is None:
+                return False
+            logger.info(f"Backfill {name} completed: {checkpoint['items_seen']} articles seen, "
+                        f"{checkpoint['items_saved']} saved")
+            return True
+            
+        except openai.RateLimitError as e:
+            logger.warning(f"Rate limited by OpenAI ({e}); re-run later to resume from the last checkpoint")
+            return False
+        except openai.APIError as e:
+            logger.warning(f"OpenAI request failed ({e}); re-run to resume from the last checkpoint")
+            return False
+        except Exception as e:
+            logger.error(f"Backfill stopped: {e}; re-run to resume from the last checkpoint")
+            return False
+
 async def main():
     """Main function to fetch and save NBA news"""
+    parser = argparse.ArgumentParser(description='Fetch NBA news and injuries into the database')
+    parser.add_argument('--retention-days', type=int, default=30,
+                        help='Delete news older than this after fetching (0 keeps everything)')
+    parser.add_argument('--enqueue', action='store_true',
+                        help='Queue articles for news_enrichment_worker.py instead of enriching them inline')
+    parser.add_argument('--backfill', action='store_true', help='Seed historical news instead of fetching the latest')
+    parser.add_argument('--archive', help='Backfill from a JSON Lines file of ESPN article objects')
+    parser.add_argument('--since', type=lambda d: datetime.strptime(d, '%Y-%m-%d'),
+                        help='Backfill the ESPN feed back to this date (YYYY-MM-DD)')
+    parser.add_argument('--batch-size', type=int, default=50, help='Articles per committed backfill batch')
+    parser.add_argument('--concurrency', type=int, default=4, help='Parallel OpenAI requests during backfill')
+    parser.add_argument('--restart', action='store_true', help='Ignore the backfill checkpoint and start over')
+    args = parser.parse_args()
+    
+    if args.backfill and bool(args.archive) == bool(args.since):
+        parser.error("--backfill needs exactly one of --archive or --since")
+    
     # Check environment variables
     database_url = os.getenv('DATABASE_URL')
     openai_api_key = os.getenv('OPENAI_API_KEY')
@@ -584,6 +1205,17 @@ async def main():
         logger.error("OPENAI_API_KEY environment variable is required")
         sys.exit(1)
     
+    if args.backfill:
+        backfill = NewsBackfill(NBANewsFetcher(), DatabaseManager(database_url), args.batch_size, args.concurrency)
+        if args.archive:
+            name = f"archive:{os.path.abspath(args.archive)}"
+            success = await backfill.run(name, lambda position: backfill.archive_batches(args.archive, position), args.restart)
+        else:
+            name = f"espn_news:{args.since.date()}"
+            dedup_days = (datetime.now() - args.since).days + 1
+            success = await backfill.run(name, lambda page: backfill.feed_batches(args.since, page), args.restart, dedup_days)
+        sys.exit(0 if success else 1)
+    
     logger.info("Starting NBA news fetch process...")
     
     try:
@@ -591,19 +1223,52 @@ async def main():
         fetcher = NBANewsFetcher()
         db_manager = DatabaseManager(database_url)
         
-        # Fetch all news
-        news_items = await fetcher.fetch_all_news()
+        # Fetch all news, skipping enrichment of near-duplicates of recent (and queued) articles
+        news_items = await fetcher.fetch_all_news(
+            db_manager.build_dedup_index(30, include_queued=args.enqueue), enrich=not args.enqueue
+        )
         
         # Save news items
         saved_count = 0
+        injury_failed_count = 0
+        reported_player_ids = []
+        queued_items = []
         for news_item in news_items:
+            # Injury reports update the per-player state table; only actual
+            # transitions are also stored as news instead of every snapshot
+            if news_item.source == 'espn_injuries' and news_item.player_id:
+                reported_player_ids.append(news_item.player_id)
+                changed = db_manager.upsert_injury_status(news_item)
+                if changed is None:
+                    injury_failed_count += 1
+                    continue
+                if not changed:
+                    continue
+            
+            if news_item.duplicate_of:
+                db_manager.save_duplicate_link(news_item)
+                continue
+            
+            # Injury reports need no AI enrichment and are saved right away
+            if args.enqueue and news_item.source != 'espn_injuries':
+                queued_items.append(news_item)
+                continue
+            
             if db_manager.save_news_item(news_item):
                 saved_count += 1
         
         logger.info(f"Successfully saved {saved_count} new news items")
+        if injury_failed_count:
+            logger.error(f"Failed to update injury status for {injury_failed_count} players")
+        db_manager.enqueue_news_items(queued_items)
+        
+        # Only clear players when the injury report was actually fetched
+        if reported_player_ids:
+            db_manager.clear_recovered_injuries(reported_player_ids)
         
-        # Cleanup old news (keep last 30 days)
-        db_manager.cleanup_old_news(30)
+        # Cleanup old news (keep last 30 days by default)
+        if args.retention_days > 0:
+            db_manager.cleanup_old_news(args.retention_days)
         
         logger.info("NBA news fetch process completed successfully")
         
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+NBA Game Log Import Script for Neon Database
+
+This script appends per-game box scores from a CSV file to the nba_game_logs
+table and incrementally maintains rolling 7/14/30-day totals per player in
+nba_player_rolling. For each new game date it adds that day's lines and
+subtracts the lines of the day that falls out of each window, so an update
+costs the same no matter how many seasons of game logs are stored.
+
+Expected CSV columns (same naming as nba-stats.csv):
+    date, player_id, player, team, opp, mp, fg, fga, x3p, x3pa, ft, fta,
+    trb, ast, stl, blk, tov, pts, fpts
+
+Usage:
+    python3 import_game_logs.py box_scores_2025-01-15.csv
+    python3 import_game_logs.py --rebuild
+
+Environment Variables:
+    - NEON_DATABASE_URL: PostgreSQL connection string
+"""
+
+import os
+import csv
+import argparse
+import psycopg2
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, List
+import logging
+from import_nba_stats import safe_float, safe_int, safe_str
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+ROLLING_WINDOWS = (7, 14, 30)
+
+# Box score columns summed into nba_player_rolling
+ROLLING_COLUMNS = (
+    'minutes', 'fg_made', 'fg_attempted', 'x3p_made', 'x3p_attempted', 'ft_made', 'ft_attempted',
+    'total_rebounds', 'assists', 'steals', 'blocks', 'turnovers', 'points', 'fpts',
+)
+
+WINDOWS_SQL = ', '.join(f"({w})" for w in ROLLING_WINDOWS)
+
+# Add one day's lines and subtract the lines leaving each window in one statement
+APPLY_DAY_SQL = f"""
+    INSERT INTO nba_player_rolling AS r (player_id, window_days, player, games, {', '.join(ROLLING_COLUMNS)})
+    SELECT d.player_id, w.window_days, MAX(d.player), SUM(d.sign),
+           {', '.join(f'SUM(d.sign * COALESCE(d.{c}, 0))' for c in ROLLING_COLUMNS)}
+    FROM (VALUES {WINDOWS_SQL}) AS w(window_days)
+    CROSS JOIN LATERAL (
+        SELECT 1 AS sign, l.* FROM nba_game_logs l WHERE l.game_date = %(day)s
+        UNION ALL
+        SELECT -1 AS sign, l.* FROM nba_game_logs l WHERE l.game_date = %(day)s::date - w.window_days
+    ) d
+    GROUP BY d.player_id, w.window_days
+    ON CONFLICT (window_days, player_id) DO UPDATE SET
+        player = COALESCE(EXCLUDED.player, r.player),
+        games = r.games + EXCLUDED.games,
+        {', '.join(f'{c} = r.{c} + EXCLUDED.{c}' for c in ROLLING_COLUMNS)}
+"""
+
+# Recompute all windows from the last 30 days of logs (used after corrections)
+REBUILD_SQL = f"""
+    INSERT INTO nba_player_rolling (player_id, window_days, player, games, {', '.join(ROLLING_COLUMNS)})
+    SELECT l.player_id, w.window_days, MAX(l.player), COUNT(*),
+           {', '.join(f'SUM(COALESCE(l.{c}, 0))' for c in ROLLING_COLUMNS)}
+    FROM (VALUES {WINDOWS_SQL}) AS w(window_days)
+    JOIN nba_game_logs l
+        ON l.game_date > %(day)s::date - w.window_days AND l.game_date <= %(day)s
+    GROUP BY l.player_id, w.window_days
+"""
+
+
+class GameLogImporter:
+    def __init__(self, connection_string: str):
+        """Initialize the importer with database connection string."""
+        self.connection_string = connection_string
+        self.connection = None
+
+    def connect(self) -> bool:
+        """Establish connection to the database."""
+        try:
+            self.connection = psycopg2.connect(self.connection_string)
+            logger.info("Successfully connected to Neon database")
+            return True
+        except psycopg2.Error as e:
+            logger.error(f"Failed to connect to database: {e}")
+            return False
+
+    def disconnect(self):
+        """Close database connection."""
+        if self.connection:
+            self.connection.close()
+            logger.info("Database connection closed")
+
+    def create_tables(self) -> bool:
+        """Create the game log and rolling tables if they don't exist."""
+        try:
+            with self.connection.cursor() as cursor:
+                sql_file_path = os.path.join(os.path.dirname(__file__), '..', 'sql', 'create_nba_game_logs_table.sql')
+                with open(sql_file_path, 'r') as f:
+                    cursor.execute(f.read())
+                self.connection.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Failed to create game log tables: {e}")
+            self.connection.rollback()
+            return False
+
+    def parse_csv_row(self, row: Dict[str, str]) -> Dict[str, Any]:
+        """Parse a CSV row and convert values to appropriate types."""
+        return {
+            'game_date': datetime.strptime(row['date'].strip(), '%Y-%m-%d').date(),
+            'player_id': safe_str(row.get('player_id')),
+            'player': safe_str(row.get('player')),
+            'team': safe_str(row.get('team')),
+            'opponent': safe_str(row.get('opp')),
+            'minutes': safe_float(row.get('mp')),
+            'fg_made': safe_int(row.get('fg')),
+            'fg_attempted': safe_int(row.get('fga')),
+            'x3p_made': safe_int(row.get('x3p')),
+            'x3p_attempted': safe_int(row.get('x3pa')),
+            'ft_made': safe_int(row.get('ft')),
+            'ft_attempted': safe_int(row.get('fta')),
+            'total_rebounds': safe_int(row.get('trb')),
+            'assists': safe_int(row.get('ast')),
+            'steals': safe_int(row.get('stl')),
+            'blocks': safe_int(row.get('blk')),
+            'turnovers': safe_int(row.get('tov')),
+            'points': safe_int(row.get('pts')),
+            'fpts': safe_float(row.get('fpts')),
+        }
+
+    def get_as_of_date(self, cursor) -> Optional[date]:
+        """Last game date applied to the rolling windows."""
+        cursor.execute("SELECT as_of_date FROM nba_player_rolling_state")
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def set_as_of_date(self, cursor, day: date):
+        cursor.execute("""
+            INSERT INTO nba_player_rolling_state (id, as_of_date) VALUES (TRUE, %s)
+            ON CONFLICT (id) DO UPDATE SET as_of_date = EXCLUDED.as_of_date
+        """, (day,))
+
+    def insert_game_logs(self, cursor, logs: List[Dict[str, Any]]):
+        """Append box score lines."""
+        columns = list(logs[0].keys())
+        cursor.executemany(f"""
+            INSERT INTO nba_game_logs ({', '.join(columns)})
+            VALUES ({', '.join(f'%({c})s' for c in columns)})
+            ON CONFLICT (player_id, game_date) DO NOTHING
+        """, logs)
+
+    def advance_to(self, cursor, day: date, as_of: date):
+        """Roll the windows forward one day at a time from as_of to day."""
+        if (day - as_of).days > max(ROLLING_WINDOWS):
+            # Every window has expired (e.g. after the off-season); start over from recent logs
+            cursor.execute("DELETE FROM nba_player_rolling")
+            cursor.execute(REBUILD_SQL, {'day': day})
+            self.set_as_of_date(cursor, day)
+            return
+
+        current = as_of
+        while current < day:
+            current += timedelta(days=1)
+            cursor.execute(APPLY_DAY_SQL, {'day': current})
+        cursor.execute("DELETE FROM nba_player_rolling WHERE games <= 0")
+        self.set_as_of_date(cursor, day)
+
+    def rebuild(self) -> bool:
+        """Recompute the rolling windows from the last 30 days of game logs."""
+        try:
+            with self.connection.cursor() as cursor:
+                as_of = self.get_as_of_date(cursor)
+                if as_of is None:
+                    cursor.execute("SELECT MAX(game_date) FROM nba_game_logs")
+                    as_of = cursor.fetchone()[0]
+                if as_of is None:
+                    logger.info("No game logs to build rolling windows from")
+                    return True
+
+                cursor.execute("DELETE FROM nba_player_rolling")
+                cursor.execute(REBUILD_SQL, {'day': as_of})
+                self.set_as_of_date(cursor, as_of)
+            self.connection.commit()
+            logger.info(f"Rebuilt rolling windows as of {as_of}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to rebuild rolling windows: {e}")
+            self.connection.rollback()
+            return False
+
+    def import_csv(self, csv_file_path: str) -> bool:
+        """Append box scores from a CSV file and update the rolling windows."""
+        if not os.path.exists(csv_file_path):
+            logger.error(f"CSV file not found: {csv_file_path}")
+            return False
+
+        if not self.create_tables():
+            return False
+
+        logs = []
+        failed_count = 0
+        with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
+            for row_num, row in enumerate(csv.DictReader(csvfile), start=2):  # Start at 2 because of header
+                try:
+                    log = self.parse_csv_row(row)
+                    if not log['player_id'] or not log['player']:
+                        raise ValueError("missing player_id or player")
+                    logs.append(log)
+                except Exception as e:
+                    failed_count += 1
+                    logger.error(f"Error processing row {row_num}: {e}")
+
+        if not logs:
+            logger.warning("No box scores to import")
+            return failed_count == 0
+
+        try:
+            with self.connection.cursor() as cursor:
+                # Serialize concurrent imports so days are applied exactly once
+                cursor.execute("LOCK TABLE nba_player_rolling_state IN EXCLUSIVE MODE")
+                as_of = self.get_as_of_date(cursor)
+
+                # Windows already include days up to as_of; past days need --rebuild
+                if as_of is not None:
+                    stale = [log for log in logs if log['game_date'] <= as_of]
+                    if stale:
+                        failed_count += len(stale)
+                        logger.warning(
+                            f"Skipped {len(stale)} box scores on or before {as_of}; "
+                            "insert corrections directly and run with --rebuild"
+                        )
+                    logs = [log for log in logs if log['game_date'] > as_of]
+                    if not logs:
+                        self.connection.commit()
+                        return failed_count == 0
+                else:
+                    as_of = min(log['game_date'] for log in logs) - timedelta(days=1)
+
+                self.insert_game_logs(cursor, logs)
+                last_day = max(log['game_date'] for log in logs)
+                self.advance_to(cursor, last_day, as_of)
+
+            self.connection.commit()
+            logger.info(f"Imported {len(logs)} box scores, rolling windows now as of {last_day}")
+            return failed_count == 0
+
+        except Exception as e:
+            logger.error(f"Game log import failed: {e}")
+            self.connection.rollback()
+            return False
+
+
+def main():
+    """Main function to run the game log import."""
+    parser = argparse.ArgumentParser(description='Import NBA box scores and update rolling windows')
+    parser.add_argument('csv_file', nargs='?', help='Box score CSV file')
+    parser.add_argument('--rebuild', action='store_true', help='Recompute rolling windows from recent game logs')
+    args = parser.parse_args()
+
+    if not args.csv_file and not args.rebuild:
+        parser.error("a CSV file or --rebuild is required")
+
+    connection_string = os.getenv('NEON_DATABASE_URL')
+
+    if not connection_string:
+        logger.error("NEON_DATABASE_URL environment variable not set")
+        return False
+
+    importer = GameLogImporter(connection_string)
+
+    try:
+        if not importer.connect():
+            return False
+
+        if args.rebuild:
+            return importer.rebuild()
+        return importer.import_csv(args.csv_file)
+
+    finally:
+        importer.disconnect()
+
+
+if __name__ == "__main__":
+    success = main()
+    exit(0 if success else 1)
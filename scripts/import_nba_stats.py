@@ -11,11 +11,36 @@ import psycopg2
 from psycopg2.extras import RealDictCursor
 from typing import Optional, Dict, Any
 import logging
+from stats_snapshot import DEFAULT_SNAPSHOT_DIR, write_snapshot
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def safe_int(value: str) -> Optional[int]:
+    """Parse a CSV integer, or None for blank and 'NA' values."""
+    if not value or value.strip() == '' or value.upper() == 'NA':
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+def safe_float(value: str) -> Optional[float]:
+    """Parse a CSV float, or None for blank and 'NA' values."""
+    if not value or value.strip() == '' or value.upper() == 'NA':
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+def safe_str(value: str) -> Optional[str]:
+    """Strip a CSV string, or None for blank and 'NA' values."""
+    if not value or value.strip() == '' or value.upper() == 'NA':
+        return None
+    return value.strip()
+
 class NBAStatsImporter:
     def __init__(self, connection_string: str):
         """Initialize the importer with database connection string."""
@@ -69,27 +94,6 @@ class NBAStatsImporter:
     
     def parse_csv_row(self, row: Dict[str, str]) -> Dict[str, Any]:
         """Parse a CSV row and convert values to appropriate types."""
-        def safe_int(value: str) -> Optional[int]:
-            if not value or value.strip() == '' or value.upper() == 'NA':
-                return None
-            try:
-                return int(float(value))
-            except (ValueError, TypeError):
-                return None
-        
-        def safe_float(value: str) -> Optional[float]:
-            if not value or value.strip() == '' or value.upper() == 'NA':
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-        
-        def safe_str(value: str) -> Optional[str]:
-            if not value or value.strip() == '' or value.upper() == 'NA':
-                return None
-            return value.strip()
-        
         return {
             'season': safe_int(row.get('season')),
             'league': safe_str(row.get('lg')),
@@ -161,8 +165,18 @@ class NBAStatsImporter:
             logger.error(f"Failed to insert stats for {stats.get('player', 'unknown')}: {e}")
             return False
     
-    def import_csv(self, csv_file_path: str, clear_existing: bool = True) -> bool:
-        """Import NBA stats from CSV file."""
+    def write_snapshot(self, rows: list, snapshot_dir: str) -> bool:
+        """Write the imported rows as a columnar snapshot for analytics."""
+        try:
+            write_snapshot(rows, snapshot_dir)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write stats snapshot: {e}")
+            return False
+    
+    def import_csv(self, csv_file_path: str, clear_existing: bool = True,
+                   snapshot_dir: Optional[str] = DEFAULT_SNAPSHOT_DIR) -> bool:
+        """Import NBA stats from CSV file, and write a columnar snapshot unless snapshot_dir is None."""
         if not os.path.exists(csv_file_path):
             logger.error(f"CSV file not found: {csv_file_path}")
             return False
@@ -180,6 +194,7 @@ class NBAStatsImporter:
             # Import data from CSV
             imported_count = 0
             failed_count = 0
+            imported_rows = []
             
             with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
                 reader = csv.DictReader(csvfile)
@@ -190,6 +205,7 @@ class NBAStatsImporter:
                         
                         if self.insert_player_stats(stats):
                             imported_count += 1
+                            imported_rows.append(stats)
                             if imported_count % 50 == 0:
                                 logger.info(f"Imported {imported_count} records...")
                         else:
@@ -204,6 +220,14 @@ class NBAStatsImporter:
             self.connection.commit()
             
             logger.info(f"Import completed: {imported_count} records imported, {failed_count} failed")
+            
+            # Snapshot mirrors the table only when it was fully replaced. A failed
+            # insert aborts the transaction, so after any failure the rows above
+            # may not be in the database.
+            if failed_count:
+                logger.warning("Skipping stats snapshot because some rows failed to import")
+            elif snapshot_dir and clear_existing and imported_rows:
+                self.write_snapshot(imported_rows, snapshot_dir)
             return failed_count == 0
             
         except Exception as e:
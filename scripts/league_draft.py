@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Per-League Draft State
+
+This module keeps draft state for many fantasy leagues at once. Each league gets
+its own copy of the player pool in league_draft_state (seeded from nba_stats)
+and its own rosters in league_rosters, both keyed by (league_id, player_id), so
+leagues never share a drafted flag. Availability queries are index-only scans of
+a partial covering index on the league's available players, and recording a
+pick locks only that league's counter row and the drafted player's row, so
+leagues drafting concurrently never wait on each other.
+
+Usage:
+    python3 league_draft.py create home-league --name "Home League" --teams 12
+    python3 league_draft.py pick home-league "Team Mike" jokicni01
+    python3 league_draft.py available home-league --position PG --limit 10
+    python3 league_draft.py roster home-league "Team Mike"
+
+Environment Variables:
+    - NEON_DATABASE_URL: PostgreSQL connection string
+"""
+from dotenv import load_dotenv
+import os
+import sys
+import argparse
+import logging
+from typing import Any, Dict, List, Optional
+import psycopg2
+from psycopg2.extras import RealDictCursor, execute_values
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Best line per player in a season, the same row the chat prompt ranks on
+SEED_POOL_SQL = """
+    INSERT INTO league_draft_state (league_id, player_id, player, team, position, projected_value)
+    SELECT %(league_id)s, player_id, player, team, position, fpts_total
+    FROM (
+        SELECT DISTINCT ON (player_id) player_id, player, team, position, fpts_total
+        FROM nba_stats
+        WHERE season = %(season)s
+        ORDER BY player_id, fpts_total DESC NULLS LAST
+    ) best
+    ON CONFLICT (league_id, player_id) DO NOTHING
+"""
+
+
+class LeagueDraft:
+    def __init__(self, connection_string: str):
+        """Initialize the draft manager with database connection string."""
+        self.connection_string = connection_string
+        self.connection = None
+
+    def connect(self) -> bool:
+        """Establish connection to the database."""
+        try:
+            self.connection = psycopg2.connect(self.connection_string)
+            return True
+        except psycopg2.Error as e:
+            logger.error(f"Failed to connect to database: {e}")
+            return False
+
+    def disconnect(self):
+        """Close database connection."""
+        if self.connection:
+            self.connection.close()
+
+    def create_tables(self) -> bool:
+        """Create the league draft tables if they don't exist."""
+        try:
+            with self.connection.cursor() as cursor:
+                sql_file_path = os.path.join(os.path.dirname(__file__), '..', 'sql', 'create_league_draft_tables.sql')
+                with open(sql_file_path, 'r') as f:
+                    cursor.execute(f.read())
+                self.connection.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Failed to create league draft tables: {e}")
+            self.connection.rollback()
+            return False
+
+    def create_league(self, league_id: str, name: Optional[str] = None, num_teams: int = 12,
+                      season: Optional[int] = None) -> bool:
+        """Create a league and seed its player pool from nba_stats (latest season by default)."""
+        try:
+            with self.connection.cursor() as cursor:
+                if season is None:
+                    cursor.execute("SELECT MAX(season) FROM nba_stats")
+                    season = cursor.fetchone()[0]
+                    if season is None:
+                        logger.error("nba_stats is empty, import stats before creating a league")
+                        return False
+
+                cursor.execute("""
+                    INSERT INTO leagues (league_id, name, season, num_teams)
+                    VALUES (%s, %s, %s, %s)
+                    ON CONFLICT (league_id) DO NOTHING
+                    RETURNING league_id
+                """, (league_id, name, season, num_teams))
+                if cursor.fetchone() is None:
+                    logger.info(f"League {league_id} already exists")
+                    self.connection.rollback()
+                    return True
+
+                cursor.execute(SEED_POOL_SQL, {'league_id': league_id, 'season': season})
+                pool_size = cursor.rowcount
+            self.connection.commit()
+            logger.info(f"Created league {league_id} with {pool_size} players from the {season} season")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to create league {league_id}: {e}")
+            self.connection.rollback()
+            return False
+
+    def set_projections(self, league_id: str, projections: Dict[str, float]) -> int:
+        """Replace projected values for a league (e.g. custom scoring), returning rows updated."""
+        try:
+            with self.connection.cursor() as cursor:
+                execute_values(cursor, """
+                    UPDATE league_draft_state AS s
+                    SET projected_value = v.projected_value
+                    FROM (VALUES %s) AS v(league_id, player_id, projected_value)
+                    WHERE s.league_id = v.league_id AND s.player_id = v.player_id
+                """, [(league_id, player_id, value) for player_id, value in projections.items()],
+                    template="(%s, %s, %s::numeric)")
+                updated = cursor.rowcount
+            self.connection.commit()
+            return updated
+        except Exception as e:
+            logger.error(f"Failed to set projections for league {league_id}: {e}")
+            self.connection.rollback()
+            return 0
+
+    def record_pick(self, league_id: str, fantasy_team: str, player_id: str) -> Optional[Dict[str, Any]]:
+        """Draft a player to a fantasy team, returning the pick or None if the player is unavailable."""
+        try:
+            with self.connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                # Row lock on the league serializes picks within this league only
+                cursor.execute("""
+                    UPDATE leagues SET picks_made = picks_made + 1
+                    WHERE league_id = %s
+                    RETURNING picks_made AS pick_number, num_teams
+                """, (league_id,))
+                league = cursor.fetchone()
+                if league is None:
+                    logger.warning(f"Unknown league {league_id}")
+                    self.connection.rollback()
+                    return None
+
+                pick_number = league['pick_number']
+                cursor.execute("""
+                    UPDATE league_draft_state
+                    SET drafted_by = %s, pick_number = %s, drafted_at = CURRENT_TIMESTAMP
+                    WHERE league_id = %s AND player_id = %s AND drafted_by IS NULL
+                    RETURNING player_id, player, team, position, projected_value
+                """, (fantasy_team, pick_number, league_id, player_id))
+                player = cursor.fetchone()
+                if player is None:
+                    logger.warning(f"Player {player_id} is not available in league {league_id}")
+                    self.connection.rollback()
+                    return None
+
+                round_number = (pick_number - 1) // league['num_teams'] + 1
+                cursor.execute("""
+                    INSERT INTO league_rosters (league_id, player_id, fantasy_team, pick_number, round)
+                    VALUES (%s, %s, %s, %s, %s)
+                """, (league_id, player_id, fantasy_team, pick_number, round_number))
+            self.connection.commit()
+
+            pick = dict(player, league_id=league_id, fantasy_team=fantasy_team,
+                        pick_number=pick_number, round=round_number)
+            logger.info(f"{league_id} pick {pick_number} (round {round_number}): {fantasy_team} took {player['player']}")
+            return pick
+        except Exception as e:
+            logger.error(f"Failed to record pick of {player_id} in league {league_id}: {e}")
+            self.connection.rollback()
+            return None
+
+    def available_players(self, league_id: str, limit: int = 20, offset: int = 0,
+                          position: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Best available players in a league by projected value, optionally for one position."""
+        position_filter = "AND position = %(position)s" if position else ""
+        try:
+            with self.connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(f"""
+                    SELECT player_id, player, team, position, projected_value
+                    FROM league_draft_state
+                    WHERE league_id = %(league_id)s AND drafted_by IS NULL {position_filter}
+                    ORDER BY projected_value DESC NULLS LAST, player_id
+                    LIMIT %(limit)s OFFSET %(offset)s
+                """, {'league_id': league_id, 'position': position.upper() if position else None,
+                      'limit': limit, 'offset': offset})
+                rows = cursor.fetchall()
+            self.connection.commit()
+            return rows
+        except Exception as e:
+            logger.error(f"Failed to query available players in league {league_id}: {e}")
+            self.connection.rollback()
+            return []
+
+    def roster(self, league_id: str, fantasy_team: str) -> List[Dict[str, Any]]:
+        """Players drafted by a fantasy team, in pick order."""
+        try:
+            with self.connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute("""
+                    SELECT r.pick_number, r.round, s.player_id, s.player, s.team, s.position, s.projected_value
+                    FROM league_rosters r
+                    JOIN league_draft_state s ON s.league_id = r.league_id AND s.player_id = r.player_id
+                    WHERE r.league_id = %s AND r.fantasy_team = %s
+                    ORDER BY r.pick_number
+                """, (league_id, fantasy_team))
+                rows = cursor.fetchall()
+            self.connection.commit()
+            return rows
+        except Exception as e:
+            logger.error(f"Failed to query roster of {fantasy_team} in league {league_id}: {e}")
+            self.connection.rollback()
+            return []
+
+
+def main():
+    """Main function to manage league drafts from the command line."""
+    parser = argparse.ArgumentParser(description='Manage per-league fantasy drafts')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    create = subparsers.add_parser('create', help='Create a league and seed its player pool')
+    create.add_argument('league_id')
+    create.add_argument('--name', help='Display name')
+    create.add_argument('--teams', type=int, default=12, help='Number of fantasy teams')
+    create.add_argument('--season', type=int, help='Season to seed from (default: latest)')
+
+    pick = subparsers.add_parser('pick', help='Record a draft pick')
+    pick.add_argument('league_id')
+    pick.add_argument('fantasy_team')
+    pick.add_argument('player_id')
+
+    available = subparsers.add_parser('available', help='List best available players')
+    available.add_argument('league_id')
+    available.add_argument('--position', help='Only this position, e.g. PG')
+    available.add_argument('--limit', type=int, default=20)
+    available.add_argument('--offset', type=int, default=0)
+
+    roster = subparsers.add_parser('roster', help='List a fantasy team\'s picks')
+    roster.add_argument('league_id')
+    roster.add_argument('fantasy_team')
+
+    args = parser.parse_args()
+
+    connection_string = os.getenv('NEON_DATABASE_URL')
+    if not connection_string:
+        logger.error("NEON_DATABASE_URL environment variable not set")
+        return False
+
+    draft = LeagueDraft(connection_string)
+    try:
+        if not draft.connect():
+            return False
+
+        # Only `create` runs the DDL: its DROP/CREATE TRIGGER statements take
+        # exclusive locks that would stall picks in leagues already drafting
+        if args.command == 'create':
+            return draft.create_tables() and draft.create_league(args.league_id, args.name, args.teams, args.season)
+
+        if args.command == 'pick':
+            return draft.record_pick(args.league_id, args.fantasy_team, args.player_id) is not None
+
+        if args.command == 'available':
+            rows = draft.available_players(args.league_id, args.limit, args.offset, args.position)
+        else:
+            rows = draft.roster(args.league_id, args.fantasy_team)
+        for row in rows:
+            prefix = f"{row['pick_number']:>3}. " if 'pick_number' in row else ''
+            logger.info(f"{prefix}{row['player']:<28} {row['team'] or '':<4} {row['position'] or '':<3} {row['projected_value']}")
+        return True
+
+    finally:
+        draft.disconnect()
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+NBA Injury Status Listener
+
+This script subscribes to the 'player_injury_status' Postgres channel and logs
+every injury state transition as it happens. The notifications are sent by the
+trigger in sql/create_player_injury_status_table.sql whenever fetch_nba_news.py
+records a change in a player's status, expected return date or injury detail.
+
+It can be used as-is for monitoring or as a template for consumers that need to
+react to injury changes without polling the database.
+
+Usage:
+    python3 listen_injury_updates.py
+
+Environment Variables:
+    - DATABASE_URL: PostgreSQL connection string
+"""
+import os
+import sys
+import json
+import select
+import logging
+from typing import Callable, Dict
+import psycopg2
+import psycopg2.extensions
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+CHANNEL = 'player_injury_status'
+
+def log_change(change: Dict):
+    """Default handler that logs an injury status change"""
+    logger.info(
+        f"{change.get('player_name')} ({change.get('team')}): "
+        f"{change.get('old_status') or 'none'} -> {change.get('new_status')}"
+        + (f", expected return {change['expected_return_date']}" if change.get('expected_return_date') else '')
+    )
+
+def listen(database_url: str, handler: Callable[[Dict], None] = log_change, timeout: float = 60.0):
+    """Block forever, calling handler for every injury status notification"""
+    conn = psycopg2.connect(database_url)
+    conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"LISTEN {CHANNEL}")
+        logger.info(f"Listening for injury updates on channel '{CHANNEL}'...")
+
+        while True:
+            # Wait until the connection has data instead of polling the table
+            if select.select([conn], [], [], timeout) == ([], [], []):
+                continue
+
+            conn.poll()
+            while conn.notifies:
+                notify = conn.notifies.pop(0)
+                try:
+                    handler(json.loads(notify.payload))
+                except json.JSONDecodeError as e:
+                    logger.error(f"Invalid notification payload: {e}")
+                except Exception as e:
+                    logger.error(f"Error handling injury update: {e}")
+    finally:
+        conn.close()
+
+def main():
+    """Main function to listen for injury updates"""
+    database_url = os.getenv('DATABASE_URL')
+
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    try:
+        listen(database_url)
+    except KeyboardInterrupt:
+        logger.info("Stopped listening for injury updates")
+
+if __name__ == "__main__":
+    main()
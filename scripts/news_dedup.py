@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+NBA News Near-Duplicate Detection
+
+This module finds near-duplicate news articles with MinHash signatures and
+locality-sensitive hashing (LSH). It catches the same story reported by
+several sources or re-published with a new timestamp, which the exact
+(title, published_at) check in fetch_nba_news.py misses.
+
+fetch_nba_news.py builds an index over recent nba_news rows and checks each
+fetched article against it before any AI enrichment. Near-duplicates are not
+enriched or stored as new rows; they are linked to the canonical row in
+nba_news_duplicates instead.
+
+Each lookup hashes the article's word shingles, computes a 128-value MinHash
+signature with NumPy and probes 32 LSH bands, which takes well under a
+millisecond per article.
+
+Templated stories about different players ("X will miss Friday's game with a
+sprained ankle") share most of their shingles, so a match also requires both
+articles to mention the same player when either mentions a known one.
+
+Usage:
+    python3 news_dedup.py            # Report near-duplicate groups among recent news
+
+Environment Variables:
+    - DATABASE_URL: PostgreSQL connection string
+"""
+import os
+import re
+import sys
+import hashlib
+import logging
+import unicodedata
+from collections import defaultdict
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Set, Tuple
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NUM_PERMUTATIONS = 128
+NUM_BANDS = 32
+SHINGLE_SIZE = 3
+
+DEFAULT_THRESHOLD = 0.7
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = _MERSENNE_PRIME
+_LOW_32 = np.uint64((1 << 32) - 1)
+_LOW_29 = np.uint64((1 << 29) - 1)
+
+# Fixed seed so signatures are identical across runs and processes
+_rng = np.random.default_rng(20250101)
+_A = _rng.integers(1, (1 << 61) - 1, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_B = _rng.integers(1, (1 << 61) - 1, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def _words(text: str) -> List[str]:
+    """Lowercased, unaccented words of text"""
+    text = unicodedata.normalize('NFKD', text.lower())
+    text = ''.join(c for c in text if not unicodedata.combining(c))
+    return re.findall(r"[a-z0-9]+", text)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Word n-grams of lowercased, unaccented text"""
+    words = _words(text)
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def _reduce_mersenne(x: np.ndarray) -> np.ndarray:
+    """x mod (2^61 - 1) for values below 2^64, using 2^61 = 1"""
+    x = (x & _MERSENNE_PRIME) + (x >> np.uint64(61))
+    return np.where(x >= _MERSENNE_PRIME, x - _MERSENNE_PRIME, x)
+
+
+def _mulmod_mersenne(a: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """a * x mod (2^61 - 1) for a, x below 2^61, without 64-bit overflow.
+
+    Splits both factors into 32-bit halves: with 2^61 = 1 (mod p), the high
+    product contributes hi * 8 (2^64 = 8) and the cross terms are folded at
+    bit 29 (2^32 * 2^29 = 2^61 = 1).
+    """
+    a_hi, a_lo = a >> np.uint64(32), a & _LOW_32
+    x_hi, x_lo = x >> np.uint64(32), x & _LOW_32
+
+    high = (a_hi * x_hi) << np.uint64(3)                  # < 2^61
+    mid = a_hi * x_lo + a_lo * x_hi                       # < 2^62
+    mid = (mid >> np.uint64(29)) + ((mid & _LOW_29) << np.uint64(32))  # < 2^61 + 2^33
+    low = _reduce_mersenne(a_lo * x_lo)                   # a_lo * x_lo < 2^64
+
+    return _reduce_mersenne(_reduce_mersenne(high + mid) + low)
+
+
+def minhash(shingle_set: Set[str]) -> np.ndarray:
+    """MinHash signature of a shingle set"""
+    if not shingle_set:
+        return np.full(NUM_PERMUTATIONS, _MAX_HASH, dtype=np.uint64)
+
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little') for s in shingle_set),
+        dtype=np.uint64,
+        count=len(shingle_set),
+    )
+    # (a * x + b) mod p for every shingle and permutation, with a, b uniform in [1, p)
+    x = _reduce_mersenne(hashes)[:, np.newaxis]
+    permuted = _reduce_mersenne(_mulmod_mersenne(_A[np.newaxis, :], x) + _B)
+    return permuted.min(axis=0)
+
+
+class EntityMatcher:
+    """Finds which known names (e.g. players) a text mentions"""
+
+    def __init__(self, names: Iterable[str]):
+        normalized = {' '.join(_words(name)) for name in names if name}
+        # Single words ("Lakers", "Davis") are too ambiguous to tell stories apart
+        full_names = sorted((n for n in normalized if ' ' in n), key=len, reverse=True)
+        self._pattern = re.compile(r'\b(?:' + '|'.join(map(re.escape, full_names)) + r')\b') if full_names else None
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def entities(self, text: str) -> FrozenSet[str]:
+        """Known names mentioned in text"""
+        if self._pattern is None:
+            return frozenset()
+        return frozenset(self._pattern.findall(' '.join(_words(text))))
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index mapping articles to keys (e.g. nba_news ids)"""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_bands: int = NUM_BANDS,
+                 entity_matcher: Optional[EntityMatcher] = None):
+        if NUM_PERMUTATIONS % num_bands:
+            raise ValueError(f"num_bands must divide {NUM_PERMUTATIONS}")
+        self.threshold = threshold
+        self.num_bands = num_bands
+        self.rows_per_band = NUM_PERMUTATIONS // num_bands
+        self.entity_matcher = entity_matcher
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [defaultdict(list) for _ in range(num_bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._entities: Dict[Hashable, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _bands(self, signature: np.ndarray) -> List[bytes]:
+        return [band.tobytes() for band in signature.reshape(self.num_bands, self.rows_per_band)]
+
+    def signature(self, title: str, content: Optional[str] = None) -> np.ndarray:
+        """MinHash signature of an article's title and content"""
+        return minhash(shingles(f"{title} {content or ''}"))
+
+    def _article_entities(self, title: str, content: Optional[str]) -> FrozenSet[str]:
+        if not self.entity_matcher:
+            return frozenset()
+        return self.entity_matcher.entities(f"{title} {content or ''}")
+
+    def add(self, key: Hashable, title: str, content: Optional[str] = None,
+            signature: Optional[np.ndarray] = None):
+        """Index an article under key"""
+        if signature is None:
+            signature = self.signature(title, content)
+        self._signatures[key] = signature
+        self._entities[key] = self._article_entities(title, content)
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket[band].append(key)
+
+    def remove(self, key: Hashable):
+        """Drop an indexed article"""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        del self._entities[key]
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            keys = bucket[band]
+            keys.remove(key)
+            if not keys:
+                del bucket[band]
+
+    def find_duplicate(self, title: str, content: Optional[str] = None,
+                       signature: Optional[np.ndarray] = None) -> Optional[Tuple[Hashable, float]]:
+        """Return (key, estimated Jaccard similarity) of the closest indexed
+        article at or above the threshold, or None
+
+        When either article mentions known players, they must share one.
+        """
+        if signature is None:
+            signature = self.signature(title, content)
+        entities = self._article_entities(title, content)
+
+        candidates = set()
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+
+        best = None
+        for key in candidates:
+            key_entities = self._entities[key]
+            if (entities or key_entities) and not entities & key_entities:
+                continue
+            similarity = float(np.mean(self._signatures[key] == signature))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+
+def load_player_names(cursor) -> List[str]:
+    """Player names from nba_stats (when imported) and enriched nba_news rows"""
+    cursor.execute("SELECT to_regclass('nba_stats') IS NOT NULL")
+    stats_query = "UNION SELECT player FROM nba_stats" if cursor.fetchone()[0] else ""
+    cursor.execute(f"""
+        SELECT player_name FROM nba_news WHERE player_name IS NOT NULL
+        {stats_query}
+    """)
+    return [row[0] for row in cursor.fetchall()]
+
+
+def main():
+    """Report near-duplicate groups among recent news"""
+    import psycopg2
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    conn = psycopg2.connect(database_url)
+    try:
+        cursor = conn.cursor()
+        entity_matcher = EntityMatcher(load_player_names(cursor))
+        cursor.execute("""
+            SELECT id, title, content FROM nba_news
+            WHERE source <> 'espn_injuries'
+            ORDER BY published_at
+        """)
+        rows = cursor.fetchall()
+        cursor.close()
+    finally:
+        conn.close()
+
+    index = NearDuplicateIndex(entity_matcher=entity_matcher)
+    duplicate_count = 0
+    for news_id, title, content in rows:
+        match = index.find_duplicate(title, content)
+        if match:
+            duplicate_count += 1
+            logger.info(f"#{news_id} '{title[:60]}' duplicates #{match[0]} (similarity {match[1]:.2f})")
+        else:
+            index.add(news_id, title, content)
+
+    logger.info(f"{duplicate_count} near-duplicates among {len(rows)} articles")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+NBA News Enrichment Workers
+
+This script runs a pool of worker processes that enrich news articles queued by
+`fetch_nba_news.py --enqueue` in the news_enrichment_jobs table. Workers can run
+on any number of machines against the same database:
+
+- Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so workers never
+  wait on or double-claim each other's jobs
+- A claim is a lease that expires after the visibility timeout; jobs held by a
+  crashed worker are claimed again once it runs out
+- The nba_news row is written in the same transaction that marks the job done,
+  and only while the lease is still held, so an article is never lost or stored
+  twice even when a slow worker's lease was taken over
+- Failed jobs are retried with exponential backoff and move to the 'dead'
+  status after max_attempts; OpenAI rate limits are retried without using up
+  an attempt
+
+Usage:
+    python3 news_enrichment_worker.py                      # 4 worker processes
+    python3 news_enrichment_worker.py --processes 8 --visibility-timeout 600
+    python3 news_enrichment_worker.py --once               # Drain the queue and exit
+    python3 news_enrichment_worker.py --stats
+    python3 news_enrichment_worker.py --requeue-dead
+
+Environment Variables:
+    - DATABASE_URL: PostgreSQL connection string
+    - OPENAI_API_KEY: OpenAI API key for AI analysis
+"""
+from dotenv import load_dotenv
+import os
+import sys
+import time
+import socket
+import signal
+import argparse
+import logging
+import multiprocessing
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional
+import psycopg2
+from psycopg2.extras import RealDictCursor
+import openai
+from fetch_nba_news import DatabaseManager, NBANewsFetcher, NewsItem
+load_dotenv()
+
+# Configure logging; force replaces the handlers fetch_nba_news installs on import
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('nba_news_fetch.log'),
+        logging.StreamHandler()
+    ],
+    force=True
+)
+logger = logging.getLogger(__name__)
+
+NEWS_ITEM_FIELDS = {f.name for f in fields(NewsItem)}
+
+# Running jobs whose lease expired on their last attempt are dead-lettered before claiming
+EXPIRE_SQL = """
+    UPDATE news_enrichment_jobs
+    SET status = 'dead', locked_by = NULL,
+        last_error = COALESCE(last_error || E'\\n', '') || 'visibility timeout expired on the last attempt'
+    WHERE status = 'running' AND available_at <= CURRENT_TIMESTAMP AND attempts >= max_attempts
+"""
+
+CLAIM_SQL = """
+    WITH due AS (
+        SELECT id FROM news_enrichment_jobs
+        WHERE status IN ('pending', 'running') AND available_at <= CURRENT_TIMESTAMP
+        ORDER BY available_at, id
+        LIMIT %(limit)s
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE news_enrichment_jobs j
+    SET status = 'running',
+        attempts = j.attempts + 1,
+        locked_by = %(worker)s,
+        locked_at = CURRENT_TIMESTAMP,
+        available_at = CURRENT_TIMESTAMP + %(timeout)s * INTERVAL '1 second'
+    FROM due
+    WHERE j.id = due.id
+    RETURNING j.id, j.attempts, j.max_attempts, j.payload
+"""
+
+
+@dataclass
+class Job:
+    """A claimed job; (id, attempt) is the lease that completing or retrying it must still hold"""
+    id: int
+    attempt: int
+    max_attempts: int
+    news_item: NewsItem
+
+
+class NewsJobQueue:
+    def __init__(self, connection_string: str, worker_id: str, visibility_timeout: int = 300,
+                 retry_delay: int = 30):
+        """Initialize the queue client with database connection string."""
+        self.connection_string = connection_string
+        self.worker_id = worker_id
+        self.visibility_timeout = visibility_timeout
+        self.retry_delay = retry_delay
+        self.db_manager = DatabaseManager(connection_string)
+        self.connection = None
+
+    def connect(self) -> bool:
+        """Establish connection to the database."""
+        try:
+            self.connection = psycopg2.connect(self.connection_string)
+            return True
+        except psycopg2.Error as e:
+            logger.error(f"Failed to connect to database: {e}")
+            return False
+
+    def disconnect(self):
+        """Close database connection."""
+        if self.connection:
+            self.connection.close()
+
+    def claim(self, limit: int = 1) -> List[Job]:
+        """Claim up to `limit` due jobs for this worker."""
+        with self.connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(EXPIRE_SQL)
+            cursor.execute(CLAIM_SQL, {'limit': limit, 'worker': self.worker_id, 'timeout': self.visibility_timeout})
+            rows = cursor.fetchall()
+        self.connection.commit()
+
+        return [
+            Job(row['id'], row['attempts'], row['max_attempts'],
+                NewsItem(**{k: v for k, v in row['payload'].items() if k in NEWS_ITEM_FIELDS}))
+            for row in rows
+        ]
+
+    def complete(self, job: Job, news_item: NewsItem) -> bool:
+        """Write the enriched article and mark the job done, if this worker still holds the lease."""
+        try:
+            with self.connection.cursor() as cursor:
+                # Locks the job row, so the lease cannot be taken over until this commits
+                cursor.execute("""
+                    UPDATE news_enrichment_jobs
+                    SET status = 'done', locked_by = NULL, completed_at = CURRENT_TIMESTAMP
+                    WHERE id = %s AND status = 'running' AND locked_by = %s AND attempts = %s
+                    RETURNING id
+                """, (job.id, self.worker_id, job.attempt))
+                if cursor.fetchone() is None:
+                    logger.warning(f"Lost the lease on job {job.id}; another worker will finish it")
+                    self.connection.rollback()
+                    return False
+
+                cursor.execute(
+                    self.db_manager.INSERT_NEWS_QUERY + " ON CONFLICT (title, published_at) DO NOTHING RETURNING id",
+                    self.db_manager._news_item_row(news_item)
+                )
+                result = cursor.fetchone()
+                if result:
+                    cursor.execute("UPDATE news_enrichment_jobs SET news_id = %s WHERE id = %s", (result[0], job.id))
+            self.connection.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Failed to complete job {job.id}: {e}")
+            self.connection.rollback()
+            return False
+
+    def retry(self, job: Job, error: Exception, count_attempt: bool = True, delay: Optional[int] = None):
+        """Release a failed job for a later retry, or dead-letter it when out of attempts."""
+        if delay is None:
+            delay = min(self.retry_delay * 2 ** (job.attempt - 1), 3600)
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute("""
+                    UPDATE news_enrichment_jobs
+                    SET attempts = attempts - %(refund)s,
+                        status = CASE WHEN attempts - %(refund)s >= max_attempts THEN 'dead' ELSE 'pending' END,
+                        available_at = CURRENT_TIMESTAMP + %(delay)s * INTERVAL '1 second',
+                        locked_by = NULL,
+                        last_error = %(error)s
+                    WHERE id = %(id)s AND status = 'running' AND locked_by = %(worker)s AND attempts = %(attempt)s
+                    RETURNING status
+                """, {'refund': 0 if count_attempt else 1, 'delay': delay, 'error': f"{type(error).__name__}: {error}",
+                      'id': job.id, 'worker': self.worker_id, 'attempt': job.attempt})
+                row = cursor.fetchone()
+            self.connection.commit()
+            if row and row[0] == 'dead':
+                logger.error(f"Job {job.id} failed {job.attempt} times and was moved to dead: {error}")
+            elif row:
+                logger.warning(f"Job {job.id} failed (attempt {job.attempt}), retrying in {delay}s: {error}")
+        except Exception as e:
+            logger.error(f"Failed to release job {job.id}: {e}")
+            self.connection.rollback()
+
+    def stats(self) -> Dict[str, Any]:
+        """Job counts per status, plus how many are due now."""
+        with self.connection.cursor() as cursor:
+            cursor.execute("SELECT status, COUNT(*) FROM news_enrichment_jobs GROUP BY status")
+            counts = {status: 0 for status in ('pending', 'running', 'done', 'dead')}
+            counts.update(dict(cursor.fetchall()))
+            cursor.execute("""
+                SELECT COUNT(*) FROM news_enrichment_jobs
+                WHERE status IN ('pending', 'running') AND available_at <= CURRENT_TIMESTAMP
+            """)
+            counts['due'] = cursor.fetchone()[0]
+        self.connection.commit()
+        return counts
+
+    def requeue_dead(self) -> int:
+        """Give dead jobs a fresh set of attempts."""
+        with self.connection.cursor() as cursor:
+            cursor.execute("""
+                UPDATE news_enrichment_jobs
+                SET status = 'pending', attempts = 0, available_at = CURRENT_TIMESTAMP
+                WHERE status = 'dead'
+            """)
+            requeued = cursor.rowcount
+        self.connection.commit()
+        return requeued
+
+    def purge_done(self, days: int) -> int:
+        """Delete jobs completed more than `days` days ago."""
+        with self.connection.cursor() as cursor:
+            cursor.execute("""
+                DELETE FROM news_enrichment_jobs
+                WHERE status = 'done' AND completed_at < CURRENT_TIMESTAMP - %s * INTERVAL '1 day'
+            """, (days,))
+            purged = cursor.rowcount
+        self.connection.commit()
+        return purged
+
+
+def run_worker(database_url: str, batch_size: int, visibility_timeout: int, poll_interval: float, once: bool):
+    """Claim and enrich jobs until stopped (or, with once, until none are due)"""
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    # Finish the current job on Ctrl-C or SIGTERM instead of abandoning its lease
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    queue = NewsJobQueue(database_url, worker_id, visibility_timeout)
+    fetcher = NBANewsFetcher()
+    processed = 0
+
+    while not stopping:
+        try:
+            if queue.connection is None or queue.connection.closed:
+                if not queue.connect():
+                    time.sleep(poll_interval)
+                    continue
+
+            jobs = queue.claim(batch_size)
+            if not jobs:
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            for job in jobs:
+                try:
+                    enriched = fetcher.enrich_news_item(job.news_item)
+                except openai.RateLimitError as e:
+                    queue.retry(job, e, count_attempt=False, delay=60)
+                    continue
+                except Exception as e:
+                    queue.retry(job, e)
+                    continue
+                if queue.complete(job, enriched):
+                    processed += 1
+
+        except psycopg2.OperationalError as e:
+            # Claimed jobs are picked up again after their visibility timeout
+            logger.error(f"Database connection lost: {e}")
+            queue.disconnect()
+            time.sleep(poll_interval)
+
+    queue.disconnect()
+    logger.info(f"Worker {worker_id} stopped after enriching {processed} articles")
+
+
+def main():
+    """Main function to run the enrichment worker pool."""
+    parser = argparse.ArgumentParser(description='Enrich queued NBA news articles')
+    parser.add_argument('--processes', type=int, default=4, help='Worker processes on this machine')
+    parser.add_argument('--batch-size', type=int, default=1, help='Jobs claimed at a time per worker')
+    parser.add_argument('--visibility-timeout', type=int, default=300,
+                        help='Seconds before a claimed job is handed to another worker')
+    parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds between polls of an empty queue')
+    parser.add_argument('--once', action='store_true', help='Exit when no jobs are due')
+    parser.add_argument('--stats', action='store_true', help='Print job counts per status and exit')
+    parser.add_argument('--requeue-dead', action='store_true', help='Retry dead jobs and exit')
+    parser.add_argument('--purge-done-days', type=int, help='Delete jobs completed more than this many days ago and exit')
+    args = parser.parse_args()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        return False
+
+    if args.stats or args.requeue_dead or args.purge_done_days is not None:
+        queue = NewsJobQueue(database_url, 'admin')
+        if not queue.connect():
+            return False
+        try:
+            if args.requeue_dead:
+                logger.info(f"Requeued {queue.requeue_dead()} dead jobs")
+            if args.purge_done_days is not None:
+                logger.info(f"Purged {queue.purge_done(args.purge_done_days)} completed jobs")
+            for status, count in queue.stats().items():
+                logger.info(f"{status:<8} {count}")
+            return True
+        finally:
+            queue.disconnect()
+
+    if not os.getenv('OPENAI_API_KEY'):
+        logger.error("OPENAI_API_KEY environment variable is required")
+        return False
+
+    logger.info(f"Starting {args.processes} enrichment workers")
+    workers = [
+        multiprocessing.Process(
+            target=run_worker, name=f"worker-{i + 1}",
+            args=(database_url, args.batch_size, args.visibility_timeout, args.poll_interval, args.once)
+        )
+        for i in range(args.processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    # Forward SIGTERM so workers finish their current job; Ctrl-C reaches them directly
+    signal.signal(signal.SIGTERM, lambda signum, frame: [w.terminate() for w in workers if w.is_alive()])
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for worker in workers:
+        worker.join()
+    return all(worker.exitcode == 0 for worker in workers)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Cached Read-Only Query Service
+
+This module executes the bot's generated SQL against nba_stats / nba_news with
+an in-memory result cache, so repeated questions (e.g. "top available centers"
+on draft night) are answered without touching the database.
+
+- SQL text is normalized (comments removed, whitespace collapsed, keywords
+  lowercased) so trivially different spellings share one cache entry; the
+  query itself always runs exactly as written
+- Results are kept in an LRU cache bounded by entry count and estimated memory
+- Entries are dropped as soon as import_nba_stats.py, fetch_nba_news.py or any
+  other writer commits to a table the query reads. Writes are announced on the
+  'data_version' channel by the triggers in sql/create_data_versions_table.sql
+- Only single SELECT / WITH statements are accepted, and they run in a
+  read-only transaction as a second line of defence
+
+Usage:
+    python3 query_cache.py "SELECT player, fpts_total FROM nba_stats WHERE position = 'C' ORDER BY fpts_total DESC LIMIT 10"
+
+Environment Variables:
+    - DATABASE_URL: PostgreSQL connection string
+"""
+import os
+import re
+import sys
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Tuple
+import psycopg2
+import psycopg2.extensions
+from psycopg2.extras import RealDictCursor
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+NOTIFY_CHANNEL = 'data_version'
+
+# Tables whose writes are announced by sql/create_data_versions_table.sql
+TRACKED_TABLES = frozenset({
+    'nba_stats', 'nba_news', 'player_injury_status', 'player_context',
+    'league_draft_state', 'league_rosters',
+    'nba_game_logs', 'nba_player_rolling', 'nba_player_rolling_state',
+})
+
+# Views the bot can query, mapped to the tracked tables they read
+VIEW_TABLES = {
+    'active_injuries': frozenset({'nba_news'}),
+    'recent_nba_news': frozenset({'nba_news'}),
+    'nba_player_rolling_averages': frozenset({'nba_player_rolling', 'nba_player_rolling_state'}),
+}
+
+# Other statement types are already rejected by requiring a single statement
+# that starts with SELECT or WITH; these can appear inside one
+FORBIDDEN_KEYWORDS = frozenset({
+    'insert', 'update', 'delete', 'merge', 'into', 'drop', 'alter', 'truncate',
+    'create', 'grant', 'revoke',
+})
+
+_TOKEN_RE = re.compile(r"""
+    (?P<comment>--[^\n]*|/\*.*?\*/)
+  | (?P<string>[eE]'(?:[^'\\]|\\.|'')*'
+              |'(?:[^']|'')*'
+              |\$(?P<tag>[A-Za-z_][A-Za-z0-9_]*|)\$.*?\$(?P=tag)\$)
+  | (?P<ident>"(?:[^"]|"")*")
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<number>\d+(?:\.\d*)?(?:[eE][-+]?\d+)?|\.\d+)
+  | (?P<space>\s+)
+  | (?P<other>.)
+""", re.VERBOSE | re.DOTALL)
+
+
+def normalize_sql(query: str) -> Tuple[str, List[str]]:
+    """Return the normalized SQL text and its lowercased keyword tokens.
+
+    String literals (including E'' and dollar-quoted strings) and quoted
+    identifiers are kept verbatim, everything else is lowercased and separated
+    by single spaces. The normalized text is only a cache key and is never
+    executed. The keyword tokens are the bare words plus any statement
+    separators.
+    """
+    parts: List[Tuple[str, str]] = []
+    for match in _TOKEN_RE.finditer(query):
+        kind = match.lastgroup
+        if kind in ('comment', 'space'):
+            continue
+        token = match.group()
+        parts.append((kind, token.lower() if kind == 'word' else token))
+
+    while parts and parts[-1] == ('other', ';'):
+        parts.pop()
+    words = [token for kind, token in parts if kind == 'word' or token == ';']
+    return ' '.join(token for _, token in parts), words
+
+
+def check_read_only(normalized: str, words: List[str]):
+    """Raise ValueError unless the query is a single SELECT statement"""
+    if not words or words[0] not in ('select', 'with'):
+        raise ValueError("Only SELECT queries are allowed")
+    if ';' in words:
+        raise ValueError("Only a single statement is allowed")
+    forbidden = FORBIDDEN_KEYWORDS.intersection(words)
+    if forbidden:
+        raise ValueError(f"Only SELECT queries are allowed (found {', '.join(sorted(forbidden))})")
+
+
+def estimate_size(value: Any) -> int:
+    """Rough memory footprint of a result set in bytes"""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class CachedQueryService:
+    """Executes read-only SQL with a write-invalidated LRU result cache"""
+
+    def __init__(self, database_url: str, max_entries: int = 1024,
+                 max_bytes: int = 64 * 1024 * 1024, statement_timeout_ms: int = 10000):
+        self.database_url = database_url
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.statement_timeout_ms = statement_timeout_ms
+
+        # normalized sql (cache key only) -> (rows, tables read, estimated bytes)
+        self._cache: "OrderedDict[str, Tuple[List[Dict[str, Any]], FrozenSet[str], int]]" = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self._query_conn = None
+        self._listen_conn = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        """Open the query and listener connections if they are not open"""
+        if self._query_conn is None or self._query_conn.closed:
+            self._query_conn = psycopg2.connect(self.database_url)
+            self._query_conn.set_session(readonly=True, autocommit=False)
+
+        if self._listen_conn is None or self._listen_conn.closed:
+            self._listen_conn = psycopg2.connect(self.database_url)
+            self._listen_conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with self._listen_conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+            # Writes may have been missed while not listening
+            self._clear()
+
+    def close(self):
+        """Close database connections"""
+        for conn in (self._query_conn, self._listen_conn):
+            if conn is not None and not conn.closed:
+                conn.close()
+
+    def _clear(self):
+        self._cache.clear()
+        self._cache_bytes = 0
+
+    def _evict(self, key: str):
+        _, _, size = self._cache.pop(key)
+        self._cache_bytes -= size
+
+    def _process_notifications(self):
+        """Drop entries that read from tables written since the last call.
+
+        conn.poll() only reads what is already on the socket, so this does not
+        cost a database round trip.
+        """
+        try:
+            self._listen_conn.poll()
+        except psycopg2.Error as e:
+            logger.warning(f"Lost data_version listener, clearing cache: {e}")
+            self._listen_conn.close()
+            self._clear()
+            return
+
+        changed = set()
+        while self._listen_conn.notifies:
+            changed.add(self._listen_conn.notifies.pop(0).payload)
+        if not changed:
+            return
+
+        # An empty table set means the query reads no tracked table, so any write may affect it
+        stale = [key for key, (_, tables, _) in self._cache.items() if not tables or tables & changed]
+        for key in stale:
+            self._evict(key)
+        logger.info(f"Invalidated {len(stale)} cached queries after writes to {', '.join(sorted(changed))}")
+
+    def _store(self, key: str, rows: List[Dict[str, Any]], tables: FrozenSet[str]):
+        size = estimate_size(rows)
+        if size > self.max_bytes:
+            return
+        if key in self._cache:
+            self._evict(key)
+        self._cache[key] = (rows, tables, size)
+        self._cache_bytes += size
+        while self._cache and (len(self._cache) > self.max_entries or self._cache_bytes > self.max_bytes):
+            self._evict(next(iter(self._cache)))
+
+    def query(self, sql: str) -> List[Dict[str, Any]]:
+        """Run a read-only query, serving it from cache when possible.
+
+        Returned rows are shared with the cache and must not be modified.
+        """
+        normalized, words = normalize_sql(sql)
+        check_read_only(normalized, words)
+
+        # Queries that read no tracked table or view are invalidated by any write
+        tables = TRACKED_TABLES.intersection(words).union(
+            *(VIEW_TABLES[view] for view in VIEW_TABLES.keys() & set(words))
+        )
+
+        with self._lock:
+            self._connect()
+            self._process_notifications()
+
+            cached = self._cache.get(normalized)
+            if cached is not None:
+                self._cache.move_to_end(normalized)
+                self.hits += 1
+                return cached[0]
+
+            self.misses += 1
+            try:
+                with self._query_conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                    cursor.execute("SET LOCAL statement_timeout = %s", (self.statement_timeout_ms,))
+                    cursor.execute(sql)
+                    rows = cursor.fetchall()
+            finally:
+                self._query_conn.rollback()
+
+            self._store(normalized, rows, tables)
+            return rows
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss counters and current size"""
+        with self._lock:
+            return {
+                'entries': len(self._cache),
+                'bytes': self._cache_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+
+def main():
+    """Main function to run a query through the cache"""
+    if len(sys.argv) < 2:
+        logger.error("Usage: python3 query_cache.py \"SELECT ...\"")
+        sys.exit(1)
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    service = CachedQueryService(database_url)
+    try:
+        for attempt in ('cold', 'warm'):
+            start = time.perf_counter()
+            rows = service.query(sys.argv[1])
+            logger.info(f"{attempt}: {len(rows)} rows in {(time.perf_counter() - start) * 1000:.2f} ms")
+        for row in rows:
+            logger.info(dict(row))
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    finally:
+        service.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+NBA Fantasy Bot Micro-Benchmarks
+
+This script times the hot paths of the ingestion scripts on synthetic data at
+1x, 100x and 10,000x today's size (see benchmark_data.py) and writes the
+results to a JSON file, so a regression shows up by comparing two runs:
+
+    stats.parse_csv_row                 csv.DictReader + NBAStatsImporter.parse_csv_row
+    espn.injuries_parse                 NBANewsFetcher.fetch_espn_injuries on a canned response
+    espn.news_parse                     NBANewsFetcher.fetch_espn_news on a canned response
+    injuries.classify_severity          NBANewsFetcher.classify_injury_severity
+    db.import_csv                       NBAStatsImporter.import_csv (incl. snapshot)
+    db.save_news_item                   DatabaseManager.save_news_item, new articles
+    db.upsert_injury_status.insert      DatabaseManager.upsert_injury_status, new players
+    db.upsert_injury_status.unchanged   DatabaseManager.upsert_injury_status, repeated report
+
+The db.* benchmarks run only when BENCH_DATABASE_URL is set. They create and
+TRUNCATE tables, so point it at a disposable local Postgres, never at Neon.
+Responses are served from memory, so the espn.* numbers cover JSON decoding
+and parsing but not the network.
+
+Usage:
+    python3 run_benchmarks.py                               # 1x and 100x
+    python3 run_benchmarks.py --scales 1,100,10000          # 10,000x needs several GB of RAM
+    python3 run_benchmarks.py --only espn --only severity
+    python3 run_benchmarks.py --compare ../data/benchmarks/20250115T120000Z.json
+
+Environment Variables:
+    - BENCH_DATABASE_URL: Disposable PostgreSQL database for the db.* benchmarks
+"""
+from dotenv import load_dotenv
+import os
+import sys
+import csv
+import json
+import time
+import platform
+import argparse
+import logging
+import statistics
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+import psycopg2
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+from benchmark_data import injuries_payload, injury_statuses, news_payload, write_stats_csv
+from fetch_nba_news import DatabaseManager, NBANewsFetcher
+from import_nba_stats import NBAStatsImporter
+
+# Per-row logging in the code under test would dominate the timings
+for name in ('fetch_nba_news', 'import_nba_stats', 'stats_snapshot'):
+    logging.getLogger(name).setLevel(logging.WARNING)
+
+DEFAULT_RESULTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'benchmarks')
+
+
+@dataclass
+class Case:
+    """One benchmark at one scale: `run` is timed, `setup` runs untimed before each repeat"""
+    items: int
+    run: Callable[[], Any]
+    setup: Optional[Callable[[], Any]] = None
+
+
+class PayloadResponse:
+    """Stands in for requests.Response, decoding the JSON body on every call like requests does"""
+
+    def __init__(self, body: str):
+        self.text = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class PayloadSession:
+    """Stands in for requests.Session, answering every GET with the same body"""
+
+    def __init__(self, body: str):
+        self.body = body
+
+    def get(self, url: str, **kwargs) -> PayloadResponse:
+        return PayloadResponse(self.body)
+
+
+def payload_fetcher(payload: Dict[str, Any]) -> NBANewsFetcher:
+    """NBANewsFetcher that serves `payload` without network or OpenAI access"""
+    fetcher = NBANewsFetcher.__new__(NBANewsFetcher)
+    fetcher.session = PayloadSession(json.dumps(payload))
+    return fetcher
+
+
+class BenchmarkContext:
+    """Caches generated inputs per scale and owns the scratch directory and database"""
+
+    def __init__(self, work_dir: str, database_url: Optional[str]):
+        self.work_dir = work_dir
+        self.database_url = database_url
+        self._cache: Dict[tuple, Any] = {}
+
+    def cached(self, key: tuple, build: Callable[[], Any]) -> Any:
+        if key not in self._cache:
+            self._cache[key] = build()
+        return self._cache[key]
+
+    def stats_csv(self, scale: int) -> tuple:
+        def build():
+            path = os.path.join(self.work_dir, f"nba_stats_{scale}x.csv")
+            return path, write_stats_csv(path, scale)
+        return self.cached(('stats_csv', scale), build)
+
+    def injury_items(self, scale: int) -> list:
+        return self.cached(('injury_items', scale), lambda: payload_fetcher(injuries_payload(scale)).fetch_espn_injuries())
+
+    def news_items(self, scale: int) -> list:
+        return self.cached(('news_items', scale), lambda: payload_fetcher(news_payload(scale)).fetch_espn_news())
+
+    def execute(self, sql: str):
+        conn = psycopg2.connect(self.database_url)
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(sql)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def prepare_database(self):
+        """Create the news tables the save paths write to (import_csv creates nba_stats itself)"""
+        sql_dir = os.path.join(os.path.dirname(__file__), '..', 'sql')
+        for name in ('create_nba_news_table.sql', 'create_player_injury_status_table.sql'):
+            with open(os.path.join(sql_dir, name), 'r') as f:
+                self.execute(f.read())
+
+
+def bench_parse_csv_row(ctx: BenchmarkContext, scale: int) -> Case:
+    path, rows = ctx.stats_csv(scale)
+    importer = NBAStatsImporter('')
+
+    def run():
+        with open(path, 'r', encoding='utf-8') as csvfile:
+            for row in csv.DictReader(csvfile):
+                importer.parse_csv_row(row)
+
+    return Case(rows, run)
+
+
+def bench_injuries_parse(ctx: BenchmarkContext, scale: int) -> Case:
+    payload = injuries_payload(scale)
+    expected = sum(len(team['injuries']) for team in payload['injuries'])
+    fetcher = payload_fetcher(payload)
+    del payload
+
+    def run():
+        # fetch_espn_injuries logs and returns [] on errors, which would time nothing
+        if len(fetcher.fetch_espn_injuries()) != expected:
+            raise RuntimeError("fetch_espn_injuries did not parse every injury")
+
+    return Case(expected, run)
+
+
+def bench_news_parse(ctx: BenchmarkContext, scale: int) -> Case:
+    payload = news_payload(scale)
+    expected = len(payload['articles'])
+    fetcher = payload_fetcher(payload)
+    del payload
+
+    def run():
+        if len(fetcher.fetch_espn_news()) != expected:
+            raise RuntimeError("fetch_espn_news did not parse every article")
+
+    return Case(expected, run)
+
+
+def bench_classify_severity(ctx: BenchmarkContext, scale: int) -> Case:
+    statuses = injury_statuses(scale)
+    fetcher = NBANewsFetcher.__new__(NBANewsFetcher)
+
+    def run():
+        for status, fantasy_status in statuses:
+            fetcher.classify_injury_severity(status, fantasy_status)
+
+    return Case(len(statuses), run)
+
+
+def bench_import_csv(ctx: BenchmarkContext, scale: int) -> Case:
+    path, rows = ctx.stats_csv(scale)
+    snapshot_dir = os.path.join(ctx.work_dir, 'snapshot')
+
+    def run():
+        importer = NBAStatsImporter(ctx.database_url)
+        if not importer.connect():
+            raise RuntimeError("could not connect to BENCH_DATABASE_URL")
+        try:
+            if not importer.import_csv(path, clear_existing=True, snapshot_dir=snapshot_dir):
+                raise RuntimeError("import_csv failed")
+        finally:
+            importer.disconnect()
+
+    return Case(rows, run)
+
+
+def bench_save_news_item(ctx: BenchmarkContext, scale: int) -> Case:
+    items = ctx.news_items(scale)
+    manager = DatabaseManager(ctx.database_url)
+
+    def run():
+        saved = sum(manager.save_news_item(item) for item in items)
+        if saved != len(items):
+            raise RuntimeError(f"save_news_item saved {saved} of {len(items)} articles")
+
+    return Case(len(items), run, setup=lambda: ctx.execute("TRUNCATE nba_news CASCADE"))
+
+
+def bench_upsert_injury_insert(ctx: BenchmarkContext, scale: int) -> Case:
+    items = ctx.injury_items(scale)
+    manager = DatabaseManager(ctx.database_url)
+
+    def run():
+        changed = sum(manager.upsert_injury_status(item) is True for item in items)
+        if changed != len(items):
+            raise RuntimeError(f"upsert_injury_status inserted {changed} of {len(items)} players")
+
+    return Case(len(items), run, setup=lambda: ctx.execute(
+        "TRUNCATE player_injury_status, player_injury_status_history"
+    ))
+
+
+def bench_upsert_injury_unchanged(ctx: BenchmarkContext, scale: int) -> Case:
+    items = ctx.injury_items(scale)
+    manager = DatabaseManager(ctx.database_url)
+
+    def setup():
+        ctx.execute("TRUNCATE player_injury_status, player_injury_status_history")
+        for item in items:
+            manager.upsert_injury_status(item)
+
+    def run():
+        unexpected = sum(manager.upsert_injury_status(item) is not False for item in items)
+        if unexpected:
+            raise RuntimeError(f"upsert_injury_status reported {unexpected} changes or errors for a repeated report")
+
+    return Case(len(items), run, setup=setup)
+
+
+# (name, needs database, case factory)
+BENCHMARKS = [
+    ('stats.parse_csv_row', False, bench_parse_csv_row),
+    ('espn.injuries_parse', False, bench_injuries_parse),
+    ('espn.news_parse', False, bench_news_parse),
+    ('injuries.classify_severity', False, bench_classify_severity),
+    ('db.import_csv', True, bench_import_csv),
+    ('db.save_news_item', True, bench_save_news_item),
+    ('db.upsert_injury_status.insert', True, bench_upsert_injury_insert),
+    ('db.upsert_injury_status.unchanged', True, bench_upsert_injury_unchanged),
+]
+
+
+def measure(case: Case, repeats: int, max_time: float) -> List[float]:
+    """Time `case.run` up to `repeats` times, stopping early once `max_time` seconds are spent"""
+    times = []
+    for _ in range(repeats):
+        if case.setup:
+            case.setup()
+        start = time.perf_counter()
+        case.run()
+        times.append(time.perf_counter() - start)
+        if sum(times) >= max_time:
+            break
+    return times
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(scales: List[int], only: List[str], repeats: int, max_time: float,
+                   database_url: Optional[str]) -> List[Dict[str, Any]]:
+    """Run every selected benchmark at every scale and return one result dict per pair"""
+    selected = [b for b in BENCHMARKS if not only or any(o in b[0] for o in only)]
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix='nba_bench_') as work_dir:
+        ctx = BenchmarkContext(work_dir, database_url)
+        if database_url and any(needs_db for _, needs_db, _ in selected):
+            ctx.prepare_database()
+
+        for scale in scales:
+            for name, needs_db, factory in selected:
+                if needs_db and not database_url:
+                    continue
+                case = factory(ctx, scale)
+                times = measure(case, repeats, max_time)
+                result = {
+                    'name': name,
+                    'scale': scale,
+                    'items': case.items,
+                    'runs': len(times),
+                    'min_s': min(times),
+                    'median_s': statistics.median(times),
+                    'mean_s': statistics.mean(times),
+                }
+                result['per_item_us'] = result['median_s'] / case.items * 1e6 if case.items else None
+                results.append(result)
+                logger.info(
+                    f"{name:<36} {scale:>6}x {case.items:>10,} items  "
+                    f"median {result['median_s'] * 1000:10.2f} ms  ({result['per_item_us']:.2f} us/item)"
+                )
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, threshold: float) -> bool:
+    """Log median time ratios against a previous results file; returns False on any regression"""
+    with open(baseline_path, 'r') as f:
+        baseline = {(r['name'], r['scale']): r for r in json.load(f)['results']}
+
+    ok = True
+    for result in results:
+        previous = baseline.get((result['name'], result['scale']))
+        if not previous:
+            continue
+        ratio = result['median_s'] / previous['median_s']
+        regressed = ratio > 1 + threshold
+        ok = ok and not regressed
+        (logger.warning if regressed else logger.info)(
+            f"{result['name']:<36} {result['scale']:>6}x  {ratio:5.2f}x baseline"
+            + ("  REGRESSION" if regressed else "")
+        )
+    return ok
+
+
+def main():
+    """Main function to run the benchmarks."""
+    parser = argparse.ArgumentParser(description='Benchmark NBA fantasy bot hot paths on synthetic data')
+    parser.add_argument('--scales', default='1,100', help='Comma-separated multiples of today\'s data size')
+    parser.add_argument('--only', action='append', default=[], help='Run benchmarks whose name contains this (repeatable)')
+    parser.add_argument('--repeats', type=int, default=5, help='Timed runs per benchmark and scale')
+    parser.add_argument('--max-time', type=float, default=30.0, help='Stop repeating a benchmark after this many seconds')
+    parser.add_argument('--output', help='Results file (default: data/benchmarks/<timestamp>.json)')
+    parser.add_argument('--compare', help='Previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='Median slowdown that counts as a regression')
+    args = parser.parse_args()
+
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+
+    database_url = os.getenv('BENCH_DATABASE_URL')
+    if database_url and database_url in (os.getenv('DATABASE_URL'), os.getenv('NEON_DATABASE_URL')):
+        logger.error("BENCH_DATABASE_URL must not be the production database, the benchmarks truncate tables")
+        return False
+    if not database_url:
+        logger.info("BENCH_DATABASE_URL not set, skipping db.* benchmarks")
+
+    created_at = datetime.now(timezone.utc)
+    results = run_benchmarks(scales, args.only, args.repeats, args.max_time, database_url)
+
+    output = args.output or os.path.join(DEFAULT_RESULTS_DIR, created_at.strftime('%Y%m%dT%H%M%SZ') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'created_at': created_at.isoformat(),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'processor': platform.machine(),
+            'scales': scales,
+            'results': results,
+        }, f, indent=2)
+    logger.info(f"Results written to {output}")
+
+    if args.compare:
+        return compare(results, args.compare, args.threshold)
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+NBA News Search
+
+This module provides ranked full-text, fuzzy and player-scoped search over the
+nba_news table. It relies on the search_vector column and trigram indexes added
+by sql/add_nba_news_search_index.sql, so every lookup is served from a GIN index
+instead of ILIKE scans over the whole table.
+
+Usage:
+    python3 search_nba_news.py "hamstring"
+    python3 search_nba_news.py "trade rumors" --player "Nikola Jokic"
+    python3 search_nba_news.py --player "jokic" --page 2
+
+Environment Variables:
+    - DATABASE_URL: PostgreSQL connection string
+"""
+import os
+import sys
+import argparse
+import logging
+from typing import Any, Dict, List, Optional
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+RESULT_COLUMNS = """
+    id, player_name, player_id, team, title, summary, category, severity,
+    impact_level, status, published_at, source, source_url, fantasy_impact_note
+"""
+
+class NBANewsSearch:
+    def __init__(self, connection_string: str, min_similarity: float = 0.3):
+        """Initialize the search client with database connection string."""
+        self.connection_string = connection_string
+        self.min_similarity = min_similarity
+        self.connection = None
+
+    def connect(self) -> bool:
+        """Establish connection to the database."""
+        try:
+            self.connection = psycopg2.connect(self.connection_string)
+            return True
+        except psycopg2.Error as e:
+            logger.error(f"Failed to connect to database: {e}")
+            return False
+
+    def disconnect(self):
+        """Close database connection."""
+        if self.connection:
+            self.connection.close()
+
+    def _fetch(self, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run a search query with the configured trigram similarity threshold."""
+        try:
+            with self.connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                # The % operator uses this threshold, which keeps fuzzy matches index-backed
+                cursor.execute("SET LOCAL pg_trgm.similarity_threshold = %s", (self.min_similarity,))
+                cursor.execute(query, params)
+                results = cursor.fetchall()
+            self.connection.commit()
+            return results
+        except Exception as e:
+            self.connection.rollback()
+            logger.error(f"Search failed: {e}")
+            return []
+
+    def search(self, text: str, player_name: Optional[str] = None, category: Optional[str] = None,
+               limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """Ranked full-text search, e.g. 'hamstring' or 'trade rumors'.
+
+        Accepts web-search syntax ("quoted phrases", -excluded, OR). Optionally
+        scoped to a fuzzily matched player name and/or a news category.
+        """
+        filters = ["search_vector @@ q"]
+        if player_name:
+            filters.append("nba_unaccent(lower(player_name)) %% nba_unaccent(lower(%(player_name)s))")
+        if category:
+            filters.append("category = %(category)s")
+
+        query = f"""
+            SELECT {RESULT_COLUMNS}, ts_rank_cd(search_vector, q) AS rank
+            FROM nba_news, websearch_to_tsquery('english', nba_unaccent(%(text)s)) AS q
+            WHERE {' AND '.join(filters)}
+            ORDER BY rank DESC, published_at DESC
+            LIMIT %(limit)s OFFSET %(offset)s
+        """
+        return self._fetch(query, {
+            'text': text,
+            'player_name': player_name,
+            'category': category,
+            'limit': limit,
+            'offset': offset,
+        })
+
+    def search_player(self, player_name: str, category: Optional[str] = None,
+                      limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """Fuzzy, accent-insensitive player lookup ordered by name similarity then recency."""
+        filters = ["nba_unaccent(lower(player_name)) %% nba_unaccent(lower(%(player_name)s))"]
+        if category:
+            filters.append("category = %(category)s")
+
+        query = f"""
+            SELECT {RESULT_COLUMNS},
+                   similarity(nba_unaccent(lower(player_name)), nba_unaccent(lower(%(player_name)s))) AS similarity
+            FROM nba_news
+            WHERE {' AND '.join(filters)}
+            ORDER BY similarity DESC, published_at DESC
+            LIMIT %(limit)s OFFSET %(offset)s
+        """
+        return self._fetch(query, {
+            'player_name': player_name,
+            'category': category,
+            'limit': limit,
+            'offset': offset,
+        })
+
+    def search_titles(self, text: str, limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+        """Fuzzy headline search that tolerates typos and partial words."""
+        query = f"""
+            SELECT {RESULT_COLUMNS},
+                   similarity(nba_unaccent(lower(title)), nba_unaccent(lower(%(text)s))) AS similarity
+            FROM nba_news
+            WHERE nba_unaccent(lower(title)) %% nba_unaccent(lower(%(text)s))
+            ORDER BY similarity DESC, published_at DESC
+            LIMIT %(limit)s OFFSET %(offset)s
+        """
+        return self._fetch(query, {'text': text, 'limit': limit, 'offset': offset})
+
+
+def main():
+    """Main function to run a search from the command line."""
+    parser = argparse.ArgumentParser(description='Search NBA news')
+    parser.add_argument('text', nargs='?', help='Full-text query, e.g. "hamstring"')
+    parser.add_argument('--player', help='Player name (fuzzy, accent-insensitive)')
+    parser.add_argument('--category', help='News category, e.g. injury or trade')
+    parser.add_argument('--page', type=int, default=1, help='Result page (1-based)')
+    parser.add_argument('--page-size', type=int, default=20, help='Results per page')
+    args = parser.parse_args()
+
+    if not args.text and not args.player:
+        parser.error("a query or --player is required")
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        logger.error("DATABASE_URL environment variable is required")
+        sys.exit(1)
+
+    searcher = NBANewsSearch(database_url)
+    if not searcher.connect():
+        sys.exit(1)
+
+    try:
+        offset = (max(args.page, 1) - 1) * args.page_size
+        if args.text:
+            results = searcher.search(args.text, args.player, args.category, args.page_size, offset)
+        else:
+            results = searcher.search_player(args.player, args.category, args.page_size, offset)
+
+        for item in results:
+            logger.info(f"[{item['published_at']}] {item['title']} ({item.get('player_name') or 'no player'})")
+        logger.info(f"{len(results)} results")
+    finally:
+        searcher.disconnect()
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,11 @@ echo "🚀 Starting NBA stats import..."
 python3 import_nba_stats.py
 
 if [ $? -eq 0 ]; then
+    echo ""
+    echo "🧩 Building player context snapshots..."
+    # Skipped with a warning until the news tables exist (setup_news_fetch.sh)
+    psql $NEON_DATABASE_URL -f ../sql/create_player_context_table.sql
+    python3 build_player_context.py
     echo ""
     echo "✅ Import completed successfully!"
     echo "You can now query your NBA stats in the Neon database."
@@ -32,11 +32,27 @@ pip3 install -r requirements.txt
 # Create the NBA news table if it doesn't exist
 echo "🗄️  Setting up database table..."
 psql $DATABASE_URL -f ../sql/create_nba_news_table.sql
+psql $DATABASE_URL -f ../sql/create_player_injury_status_table.sql
+psql $DATABASE_URL -f ../sql/create_nba_news_duplicates_table.sql
+psql $DATABASE_URL -f ../sql/create_nba_news_backfill_table.sql
+psql $DATABASE_URL -f ../sql/create_news_enrichment_jobs_table.sql
+psql $DATABASE_URL -f ../sql/add_nba_news_search_index.sql
+psql $DATABASE_URL -f ../sql/create_nba_news_embeddings_table.sql
+psql $DATABASE_URL -f ../sql/create_player_context_table.sql
+psql $DATABASE_URL -f ../sql/create_data_versions_table.sql
 
 # Run the news fetch script
 echo "📰 Fetching NBA news..."
 python3 fetch_nba_news.py
 
+# Embed new and changed news for semantic retrieval
+echo "🧠 Embedding NBA news..."
+python3 embed_nba_news.py
+
+# Refresh player context snapshots for players with new news
+echo "🧩 Building player context..."
+python3 build_player_context.py
+
 echo "✅ NBA news setup completed successfully!"
 echo ""
 echo "To run news fetching regularly, you can:"
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+NBA Stats Columnar Snapshot
+
+This module writes and loads a versioned, columnar snapshot of nba_stats so
+analytics (scoring, rankings, simulations) can start without a database
+connection or re-parsing the CSV.
+
+Layout of a snapshot directory:
+    LATEST                  Name of the current version directory
+    <version>/manifest.json Format version, row count, column dtypes and string dictionaries
+    <version>/<column>.npy  One NumPy array per column
+
+Numeric columns are stored as float64 with NaN for missing values. String
+columns (player, player_id, team, position, league) are stored as int32 codes
+into a dictionary kept in the manifest, with -1 for missing values.
+
+Arrays are loaded with np.load(mmap_mode='r'): nothing is copied, loading takes
+milliseconds, and worker processes reading the same snapshot share the OS page
+cache. Versions are written to a new directory and published by atomically
+replacing LATEST, so readers never see a partially written snapshot.
+
+Usage:
+    python3 stats_snapshot.py            # Build the snapshot from the CSV
+    python3 stats_snapshot.py --info     # Show the current snapshot
+"""
+import os
+import csv
+import json
+import hashlib
+import argparse
+import logging
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+DEFAULT_SNAPSHOT_DIR = os.getenv(
+    'NBA_STATS_SNAPSHOT_DIR',
+    os.path.join(os.path.dirname(__file__), '..', 'data', 'nba_stats_snapshot')
+)
+
+STRING_COLUMNS = ('league', 'player', 'player_id', 'team', 'position')
+
+
+def write_snapshot(rows: List[Dict[str, Any]], snapshot_dir: str = DEFAULT_SNAPSHOT_DIR) -> str:
+    """Write parsed nba_stats rows as a new snapshot version and return its path.
+
+    rows are dicts as returned by NBAStatsImporter.parse_csv_row.
+    """
+    if not rows:
+        raise ValueError("Cannot write an empty snapshot")
+
+    columns = list(rows[0].keys())
+    arrays: Dict[str, np.ndarray] = {}
+    dictionaries: Dict[str, List[str]] = {}
+
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        if column in STRING_COLUMNS:
+            dictionary = sorted({v for v in values if v is not None})
+            codes = {v: i for i, v in enumerate(dictionary)}
+            arrays[column] = np.array([codes[v] if v is not None else -1 for v in values], dtype=np.int32)
+            dictionaries[column] = dictionary
+        else:
+            arrays[column] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    # Content-addressed version: identical data always maps to the same directory
+    digest = hashlib.sha256()
+    for column in columns:
+        digest.update(column.encode('utf-8'))
+        digest.update(arrays[column].tobytes())
+    digest.update(json.dumps(dictionaries, sort_keys=True).encode('utf-8'))
+    version = f"v{FORMAT_VERSION}-{digest.hexdigest()[:16]}"
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    version_dir = os.path.join(snapshot_dir, version)
+
+    if not os.path.exists(version_dir):
+        tmp_dir = tempfile.mkdtemp(prefix='.tmp-', dir=snapshot_dir)
+        for column, array in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{column}.npy"), array)
+
+        manifest = {
+            'format_version': FORMAT_VERSION,
+            'version': version,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'rows': len(rows),
+            'columns': {column: str(arrays[column].dtype) for column in columns},
+            'dictionaries': dictionaries,
+        }
+        with open(os.path.join(tmp_dir, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f)
+
+        try:
+            os.rename(tmp_dir, version_dir)
+        except OSError:
+            # A concurrent import published the same version first; its contents are identical
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            if not os.path.isdir(version_dir):
+                raise
+
+    # Publish atomically so readers never see a half-written version; the temp
+    # file is unique so concurrent imports never write to the same one
+    fd, latest_tmp = tempfile.mkstemp(prefix='.LATEST-', dir=snapshot_dir)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(version)
+        os.chmod(latest_tmp, 0o644)
+        os.replace(latest_tmp, os.path.join(snapshot_dir, 'LATEST'))
+    except BaseException:
+        os.unlink(latest_tmp)
+        raise
+
+    logger.info(f"Wrote nba_stats snapshot {version} ({len(rows)} rows)")
+    return version_dir
+
+
+class StatsSnapshot:
+    """Memory-mapped, read-only view of an nba_stats snapshot"""
+
+    def __init__(self, version_dir: str):
+        with open(os.path.join(version_dir, 'manifest.json')) as f:
+            self.manifest = json.load(f)
+
+        if self.manifest['format_version'] != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot format {self.manifest['format_version']} (expected {FORMAT_VERSION})"
+            )
+
+        self.version = self.manifest['version']
+        self.rows = self.manifest['rows']
+        self.dictionaries: Dict[str, List[str]] = self.manifest['dictionaries']
+        self._dir = version_dir
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.manifest['columns'])
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Return a column as a read-only memory-mapped array (codes for string columns)"""
+        if column not in self.manifest['columns']:
+            raise KeyError(column)
+        if column not in self._arrays:
+            self._arrays[column] = np.load(os.path.join(self._dir, f"{column}.npy"), mmap_mode='r')
+        return self._arrays[column]
+
+    def code(self, column: str, value: str) -> int:
+        """Dictionary code for a string value, or -1 if it does not occur"""
+        try:
+            return self.dictionaries[column].index(value)
+        except ValueError:
+            return -1
+
+    def decode(self, column: str, codes: np.ndarray) -> List[Optional[str]]:
+        """Map dictionary codes back to strings"""
+        dictionary = self.dictionaries[column]
+        return [dictionary[c] if c >= 0 else None for c in np.asarray(codes).tolist()]
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Materialize a single row as a dict"""
+        result = {}
+        for column in self.columns:
+            value = self[column][index]
+            if column in self.dictionaries:
+                result[column] = self.dictionaries[column][value] if value >= 0 else None
+            else:
+                result[column] = None if np.isnan(value) else float(value)
+        return result
+
+
+def load_snapshot(snapshot_dir: str = DEFAULT_SNAPSHOT_DIR, version: Optional[str] = None) -> StatsSnapshot:
+    """Open the latest (or a specific) snapshot version without copying any data"""
+    if version is None:
+        with open(os.path.join(snapshot_dir, 'LATEST')) as f:
+            version = f.read().strip()
+    return StatsSnapshot(os.path.join(snapshot_dir, version))
+
+
+def main():
+    """Main function to build or inspect the snapshot"""
+    parser = argparse.ArgumentParser(description='Build or inspect the nba_stats columnar snapshot')
+    parser.add_argument('--csv', default=os.path.join(os.path.dirname(__file__), '..', 'public', 'stats', 'nba-stats.csv'),
+                        help='Stats CSV to build from')
+    parser.add_argument('--dir', default=DEFAULT_SNAPSHOT_DIR, help='Snapshot directory')
+    parser.add_argument('--info', action='store_true', help='Show the current snapshot instead of building')
+    args = parser.parse_args()
+
+    if args.info:
+        snapshot = load_snapshot(args.dir)
+        logger.info(f"Snapshot {snapshot.version}: {len(snapshot)} rows, {len(snapshot.columns)} columns")
+        return
+
+    from import_nba_stats import NBAStatsImporter
+
+    importer = NBAStatsImporter(connection_string='')
+    with open(args.csv, 'r', encoding='utf-8') as csvfile:
+        rows = [importer.parse_csv_row(row) for row in csv.DictReader(csvfile)]
+    write_snapshot(rows, args.dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Fantasy Trade Evaluator
+
+This module evaluates every 1-for-1, 2-for-1 and 1-for-2 trade between every
+pair of teams in a league in batch, and reports the trades that help each team
+in 9-category rotisserie standings (FG%, FT%, 3PM, PTS, REB, AST, STL, BLK, TO).
+
+Each player is a vector of per-game counting stats (makes and attempts are kept
+separately so percentages are computed from team totals). For a pair of teams
+all candidate trades are expressed as one matrix of stat deltas, and the new
+category values and standings points of both sides are computed with NumPy
+broadcasting against the rest of the league, without Python loops over trades.
+A 12-team league with 13-man rosters has ~145,000 candidate trades and is
+evaluated in well under a second.
+
+When a trade is uneven, the side receiving fewer players fills the open roster
+spot with a replacement-level player (the average of the best free agents), and
+the other side drops one.
+
+Player stats are read from the nba_stats columnar snapshot (see stats_snapshot.py),
+so no database connection is needed.
+
+Usage:
+    python3 trade_evaluator.py rosters.json      # {"Team A": ["jokicni01", ...], ...}
+    python3 trade_evaluator.py --demo            # 12 teams filled by a snake draft
+
+"""
+import sys
+import json
+import time
+import argparse
+import logging
+from itertools import combinations
+from typing import Any, Dict, List, Optional
+import numpy as np
+from stats_snapshot import StatsSnapshot, load_snapshot
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Per-game stat columns in the player vectors
+STAT_COLUMNS = (
+    'fg_made', 'fg_attempted', 'ft_made', 'ft_attempted', 'x3p_made',
+    'points', 'total_rebounds', 'assists', 'steals', 'blocks', 'turnovers',
+)
+FGM, FGA, FTM, FTA, TPM, PTS, REB, AST, STL, BLK, TOV = range(len(STAT_COLUMNS))
+
+CATEGORIES = ('fg_pct', 'ft_pct', 'threes', 'points', 'rebounds', 'assists', 'steals', 'blocks', 'turnovers')
+
+REPLACEMENT_POOL_SIZE = 10
+
+
+def category_values(totals: np.ndarray) -> np.ndarray:
+    """Map stat totals [..., len(STAT_COLUMNS)] to category values [..., 9].
+
+    Turnovers are negated so that higher is better in every category.
+    """
+    fg_pct = np.divide(totals[..., FGM], totals[..., FGA],
+                       out=np.zeros(totals.shape[:-1]), where=totals[..., FGA] > 0)
+    ft_pct = np.divide(totals[..., FTM], totals[..., FTA],
+                       out=np.zeros(totals.shape[:-1]), where=totals[..., FTA] > 0)
+    return np.stack([
+        fg_pct, ft_pct,
+        totals[..., TPM], totals[..., PTS], totals[..., REB], totals[..., AST],
+        totals[..., STL], totals[..., BLK], -totals[..., TOV],
+    ], axis=-1)
+
+
+def roto_points(values: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """Total rotisserie points of teams with category values [..., 9]
+    against the other teams' values [M, 9] (ties count half)"""
+    wins = (values[..., None, :] > others).sum(axis=-2)
+    ties = (values[..., None, :] == others).sum(axis=-2)
+    return (1 + wins + 0.5 * ties).sum(axis=-1)
+
+
+class TradeEvaluator:
+    """Batch evaluator of all small trades in a league"""
+
+    def __init__(self, player_ids: List[str], player_names: List[str],
+                 stats: np.ndarray, fantasy_points: np.ndarray):
+        self.player_ids = player_ids
+        self.player_names = player_names
+        self.stats = stats
+        self.fantasy_points = fantasy_points
+        self.index = {player_id: i for i, player_id in enumerate(player_ids)}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Optional[StatsSnapshot] = None) -> 'TradeEvaluator':
+        """Build per-game player vectors from the nba_stats snapshot"""
+        snapshot = snapshot or load_snapshot()
+
+        # Traded players have several rows; keep the one with the most fantasy points
+        fpts_total = np.nan_to_num(np.asarray(snapshot['fpts_total']), nan=-np.inf)
+        codes = np.asarray(snapshot['player_id'])
+        order = np.lexsort((-fpts_total, codes))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = codes[order][1:] != codes[order][:-1]
+        rows = order[first & (codes[order] >= 0)]
+
+        games = np.asarray(snapshot['games'])[rows]
+        games = np.where(np.isnan(games) | (games <= 0), np.inf, games)
+        stats = np.stack([np.nan_to_num(np.asarray(snapshot[c])[rows]) for c in STAT_COLUMNS], axis=1)
+
+        return cls(
+            player_ids=snapshot.decode('player_id', codes[rows]),
+            player_names=snapshot.decode('player', np.asarray(snapshot['player'])[rows]),
+            stats=stats / games[:, None],
+            fantasy_points=np.nan_to_num(np.asarray(snapshot['fpts'])[rows]),
+        )
+
+    def _roster_indices(self, rosters: Dict[str, List[str]]) -> Dict[str, np.ndarray]:
+        indices = {}
+        for team, roster in rosters.items():
+            unknown = [p for p in roster if p not in self.index]
+            if unknown:
+                logger.warning(f"{team}: ignoring players without stats: {', '.join(unknown)}")
+            indices[team] = np.array([self.index[p] for p in roster if p in self.index], dtype=np.int64)
+        return indices
+
+    def _replacement_level(self, roster_indices: Dict[str, np.ndarray]) -> np.ndarray:
+        """Average per-game line of the best unrostered players"""
+        rostered = np.zeros(len(self.player_ids), dtype=bool)
+        for indices in roster_indices.values():
+            rostered[indices] = True
+        free_agents = np.flatnonzero(~rostered)
+        if len(free_agents) == 0:
+            return np.zeros(len(STAT_COLUMNS))
+        best = free_agents[np.argsort(-self.fantasy_points[free_agents])[:REPLACEMENT_POOL_SIZE]]
+        return self.stats[best].mean(axis=0)
+
+    def evaluate(self, rosters: Dict[str, List[str]]) -> 'TradeResults':
+        """Evaluate all 1-for-1, 2-for-1 and 1-for-2 trades between all team pairs"""
+        teams = list(rosters)
+        roster_indices = self._roster_indices(rosters)
+        replacement = self._replacement_level(roster_indices)
+
+        totals = np.stack([self.stats[roster_indices[t]].sum(axis=0) for t in teams])
+        values = category_values(totals)
+        before = np.array([
+            roto_points(values[i], np.delete(values, i, axis=0)) for i in range(len(teams))
+        ])
+
+        # Give-sets per team: singles and pairs as player index arrays padded with -1
+        give_sets = {}
+        for t in teams:
+            players = roster_indices[t]
+            singles = np.stack([players, np.full(len(players), -1)], axis=1)
+            pairs = np.array(list(combinations(players, 2)), dtype=np.int64).reshape(-1, 2)
+            give_sets[t] = (singles, pairs)
+
+        def sums(sets: np.ndarray) -> np.ndarray:
+            return self.stats[sets[:, 0]] + np.where(sets[:, 1:] >= 0, self.stats[sets[:, 1]], 0)
+
+        results = []
+        for a, b in combinations(range(len(teams)), 2):
+            singles_a, pairs_a = give_sets[teams[a]]
+            singles_b, pairs_b = give_sets[teams[b]]
+            others = np.delete(values, [a, b], axis=0)
+
+            for gives_a, gives_b, fill_a in (
+                (singles_a, singles_b, 0),   # 1-for-1
+                (pairs_a, singles_b, 1),     # a gives 2, gets 1 plus a replacement
+                (singles_a, pairs_b, -1),    # a gives 1, gets 2 and drops a replacement
+            ):
+                if len(gives_a) == 0 or len(gives_b) == 0:
+                    continue
+
+                # delta[i, j] = change in team a's totals when trading gives_a[i] for gives_b[j]
+                delta = sums(gives_b)[None, :, :] - sums(gives_a)[:, None, :] + fill_a * replacement
+                delta = delta.reshape(-1, len(STAT_COLUMNS))
+
+                values_a = category_values(totals[a] + delta)
+                values_b = category_values(totals[b] - delta)
+                # Each side is ranked against the rest of the league plus the other side
+                points_a = roto_points(values_a, others) + (values_a > values_b).sum(-1) + 0.5 * (values_a == values_b).sum(-1)
+                points_b = roto_points(values_b, others) + (values_b > values_a).sum(-1) + 0.5 * (values_b == values_a).sum(-1)
+
+                i, j = np.divmod(np.arange(len(delta)), len(gives_b))
+                results.append((
+                    np.full(len(delta), a), np.full(len(delta), b),
+                    gives_a[i], gives_b[j],
+                    points_a - before[a], points_b - before[b],
+                ))
+
+        if not results:
+            empty = np.empty(0)
+            return TradeResults(self, teams, empty, empty, np.empty((0, 2)), np.empty((0, 2)), empty, empty)
+        return TradeResults(self, teams, *(np.concatenate(column) for column in zip(*results)))
+
+
+class TradeResults:
+    """All evaluated trades as parallel arrays"""
+
+    def __init__(self, evaluator: TradeEvaluator, teams: List[str], team_a: np.ndarray, team_b: np.ndarray,
+                 gives_a: np.ndarray, gives_b: np.ndarray, delta_a: np.ndarray, delta_b: np.ndarray):
+        self.evaluator = evaluator
+        self.teams = teams
+        self.team_a = team_a
+        self.team_b = team_b
+        self.gives_a = gives_a
+        self.gives_b = gives_b
+        self.delta_a = delta_a
+        self.delta_b = delta_b
+
+    def __len__(self) -> int:
+        return len(self.delta_a)
+
+    def _players(self, indices: np.ndarray) -> List[str]:
+        return [self.evaluator.player_names[i] for i in indices if i >= 0]
+
+    def top_trades(self, team: str, n: int = 5, mutual: bool = True) -> List[Dict[str, Any]]:
+        """Best trades for a team by its change in standings points.
+
+        With mutual=True only trades that do not hurt the other side are
+        returned, which makes them realistic to propose.
+        """
+        t = self.teams.index(team)
+        is_a, is_b = self.team_a == t, self.team_b == t
+        own = np.where(is_a, self.delta_a, self.delta_b)
+        other = np.where(is_a, self.delta_b, self.delta_a)
+
+        mask = (is_a | is_b) & (own > 0)
+        if mutual:
+            mask &= other >= 0
+        candidates = np.flatnonzero(mask)
+        # Best for this team first, then the fairest for the partner
+        ranked = candidates[np.lexsort((-other[candidates], -own[candidates]))][:n]
+
+        trades = []
+        for k in ranked:
+            partner = self.team_b[k] if is_a[k] else self.team_a[k]
+            gives, gets = (self.gives_a[k], self.gives_b[k]) if is_a[k] else (self.gives_b[k], self.gives_a[k])
+            trades.append({
+                'team': team,
+                'partner': self.teams[int(partner)],
+                'gives': self._players(gives),
+                'gets': self._players(gets),
+                'points_change': float(own[k]),
+                'partner_points_change': float(other[k]),
+            })
+        return trades
+
+
+def demo_rosters(evaluator: TradeEvaluator, teams: int = 12, roster_size: int = 13) -> Dict[str, List[str]]:
+    """Fill a league with a snake draft by fantasy points per game"""
+    order = np.argsort(-evaluator.fantasy_points)
+    rosters = {f"Team {t + 1}": [] for t in range(teams)}
+    names = list(rosters)
+    for pick, player in enumerate(order[:teams * roster_size]):
+        rnd, slot = divmod(pick, teams)
+        team = names[slot if rnd % 2 == 0 else teams - 1 - slot]
+        rosters[team].append(evaluator.player_ids[player])
+    return rosters
+
+
+def main():
+    """Main function to evaluate all trades in a league"""
+    parser = argparse.ArgumentParser(description='Evaluate all small trades in a fantasy league')
+    parser.add_argument('rosters', nargs='?', help='JSON file mapping team name to player_id list')
+    parser.add_argument('--demo', action='store_true', help='Use a 12-team snake-drafted demo league')
+    parser.add_argument('-n', type=int, default=3, help='Trades to show per team')
+    args = parser.parse_args()
+
+    if not args.rosters and not args.demo:
+        parser.error("a rosters file or --demo is required")
+
+    evaluator = TradeEvaluator.from_snapshot()
+    if args.demo:
+        rosters = demo_rosters(evaluator)
+    else:
+        with open(args.rosters) as f:
+            rosters = json.load(f)
+
+    start = time.perf_counter()
+    results = evaluator.evaluate(rosters)
+    logger.info(f"Evaluated {len(results)} trades in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for team in rosters:
+        for trade in results.top_trades(team, args.n):
+            logger.info(
+                f"{team} trades {', '.join(trade['gives'])} to {trade['partner']} for {', '.join(trade['gets'])}: "
+                f"{trade['points_change']:+.1f} / {trade['partner_points_change']:+.1f} roto points"
+            )
+
+if __name__ == "__main__":
+    main()
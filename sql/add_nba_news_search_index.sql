@@ -0,0 +1,39 @@
+-- Migration script to add full-text and trigram search to the nba_news table
+-- Used by scripts/search_nba_news.py for ranked, fuzzy and player-scoped news lookups
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- unaccent() is only STABLE, so wrap it in an IMMUTABLE function that can be
+-- used in generated columns and expression indexes ('Jokić' -> 'Jokic')
+CREATE OR REPLACE FUNCTION nba_unaccent(text)
+RETURNS text AS $$
+    SELECT public.unaccent('public.unaccent', $1)
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+
+-- array_to_string() is only STABLE as well; tags are plain text, so joining
+-- them is safe to declare IMMUTABLE
+CREATE OR REPLACE FUNCTION nba_tags_text(text[])
+RETURNS text AS $$
+    SELECT array_to_string($1, ' ')
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT;
+
+-- Weighted document: player and headline rank above the body text
+ALTER TABLE nba_news ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', nba_unaccent(coalesce(player_name, ''))), 'A') ||
+        setweight(to_tsvector('english', nba_unaccent(coalesce(title, ''))), 'A') ||
+        setweight(to_tsvector('english', nba_unaccent(coalesce(summary, ''))), 'B') ||
+        setweight(to_tsvector('english', nba_unaccent(coalesce(content, ''))), 'C') ||
+        setweight(to_tsvector('simple', coalesce(nba_tags_text(tags), '')), 'B')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_nba_news_search_vector ON nba_news USING GIN (search_vector);
+
+-- Trigram indexes for fuzzy, accent-insensitive name and headline matching
+CREATE INDEX IF NOT EXISTS idx_nba_news_player_name_trgm
+    ON nba_news USING GIN (nba_unaccent(lower(player_name)) gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_nba_news_title_trgm
+    ON nba_news USING GIN (nba_unaccent(lower(title)) gin_trgm_ops);
+
+COMMENT ON COLUMN nba_news.search_vector IS 'Weighted full-text document over player, title, summary, content and tags';
@@ -0,0 +1,89 @@
+-- Create data version counters for Neon database
+-- Run after the nba_stats, nba_news, player_injury_status and player_context tables exist
+-- (league draft and game log tables are tracked too if sql/create_league_draft_tables.sql
+-- and sql/create_nba_game_logs_table.sql ran first)
+-- Every committed write to a tracked table bumps its version and sends a
+-- notification on the 'data_version' channel, so caches of query results
+-- (see scripts/query_cache.py) can be invalidated without polling.
+-- League draft tables only send the notification: a shared per-table counter
+-- row would make picks in different leagues wait on each other
+
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name VARCHAR(100) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE OR REPLACE FUNCTION bump_data_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO data_versions (table_name, version, updated_at)
+    VALUES (TG_TABLE_NAME, 1, CURRENT_TIMESTAMP)
+    ON CONFLICT (table_name) DO UPDATE SET
+        version = data_versions.version + 1,
+        updated_at = CURRENT_TIMESTAMP;
+
+    -- Identical notifications in one transaction are delivered once, at commit
+    PERFORM pg_notify('data_version', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Notification only, for tables written concurrently by independent sessions
+CREATE OR REPLACE FUNCTION notify_data_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('data_version', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Statement-level triggers: one bump per statement, not per row
+DROP TRIGGER IF EXISTS nba_stats_data_version ON nba_stats;
+CREATE TRIGGER nba_stats_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON nba_stats
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_data_version();
+
+DROP TRIGGER IF EXISTS nba_news_data_version ON nba_news;
+CREATE TRIGGER nba_news_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON nba_news
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_data_version();
+
+DROP TRIGGER IF EXISTS player_injury_status_data_version ON player_injury_status;
+CREATE TRIGGER player_injury_status_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON player_injury_status
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_data_version();
+
+DROP TRIGGER IF EXISTS player_context_data_version ON player_context;
+CREATE TRIGGER player_context_data_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON player_context
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION bump_data_version();
+
+DO $$
+DECLARE
+    optional_table TEXT;
+    trigger_function TEXT;
+BEGIN
+    FOR optional_table, trigger_function IN VALUES
+        ('league_draft_state', 'notify_data_change'),
+        ('league_rosters', 'notify_data_change'),
+        ('nba_game_logs', 'bump_data_version'),
+        ('nba_player_rolling', 'bump_data_version'),
+        ('nba_player_rolling_state', 'bump_data_version')
+    LOOP
+        IF to_regclass(optional_table) IS NOT NULL THEN
+            EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', optional_table || '_data_version', optional_table);
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+                'FOR EACH STATEMENT EXECUTE FUNCTION %I()',
+                optional_table || '_data_version', optional_table, trigger_function
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+COMMENT ON TABLE data_versions IS 'Write counters per table, bumped by statement triggers and announced on the data_version channel';
@@ -0,0 +1,84 @@
+-- Create per-league draft tables for Neon database
+-- Every league drafts from its own copy of the player pool, so many leagues can
+-- draft at once without sharing a global drafted flag. Picks lock only the
+-- league's own rows (see scripts/league_draft.py)
+
+CREATE TABLE IF NOT EXISTS leagues (
+    league_id VARCHAR(50) PRIMARY KEY,
+    name VARCHAR(100),
+    season INTEGER NOT NULL,
+    num_teams INTEGER NOT NULL DEFAULT 12 CHECK (num_teams > 0),
+    picks_made INTEGER NOT NULL DEFAULT 0, -- Picks are numbered from this counter
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- One row per league and player, seeded from nba_stats when the league is created
+CREATE TABLE IF NOT EXISTS league_draft_state (
+    league_id VARCHAR(50) NOT NULL REFERENCES leagues(league_id) ON DELETE CASCADE,
+    player_id VARCHAR(20) NOT NULL, -- Same ids as nba_stats.player_id
+    player VARCHAR(100) NOT NULL,
+    team VARCHAR(10),
+    position VARCHAR(5),
+    projected_value DECIMAL(10,2), -- fpts_total by default, or the league's own projection
+
+    -- NULL while the player is available
+    drafted_by VARCHAR(100),
+    pick_number INTEGER,
+    drafted_at TIMESTAMP,
+
+    PRIMARY KEY (league_id, player_id)
+);
+
+-- "Best available" in a league is an index-only scan over its available players
+CREATE INDEX IF NOT EXISTS idx_league_draft_state_available
+    ON league_draft_state(league_id, projected_value DESC NULLS LAST, player_id)
+    INCLUDE (player, team, position)
+    WHERE drafted_by IS NULL;
+
+-- "Best available guards" in a league
+CREATE INDEX IF NOT EXISTS idx_league_draft_state_available_position
+    ON league_draft_state(league_id, position, projected_value DESC NULLS LAST, player_id)
+    INCLUDE (player, team)
+    WHERE drafted_by IS NULL;
+
+CREATE TABLE IF NOT EXISTS league_rosters (
+    league_id VARCHAR(50) NOT NULL,
+    player_id VARCHAR(20) NOT NULL,
+    fantasy_team VARCHAR(100) NOT NULL,
+    pick_number INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    picked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (league_id, player_id),
+    UNIQUE (league_id, pick_number),
+    FOREIGN KEY (league_id, player_id) REFERENCES league_draft_state(league_id, player_id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_league_rosters_team
+    ON league_rosters(league_id, fantasy_team, pick_number)
+    INCLUDE (player_id);
+
+-- Announce picks on the data_version channel so cached query results are
+-- invalidated. Notification only: bumping the shared data_versions row would
+-- serialize picks across leagues (no-op until sql/create_data_versions_table.sql
+-- has been applied)
+DO $$
+BEGIN
+    IF to_regprocedure('notify_data_change()') IS NOT NULL THEN
+        DROP TRIGGER IF EXISTS league_draft_state_data_version ON league_draft_state;
+        CREATE TRIGGER league_draft_state_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON league_draft_state
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION notify_data_change();
+
+        DROP TRIGGER IF EXISTS league_rosters_data_version ON league_rosters;
+        CREATE TRIGGER league_rosters_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON league_rosters
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION notify_data_change();
+    END IF;
+END $$;
+
+COMMENT ON TABLE leagues IS 'Fantasy leagues and their draft pick counter';
+COMMENT ON TABLE league_draft_state IS 'Per-league player pool; drafted_by IS NULL means available';
+COMMENT ON TABLE league_rosters IS 'Players drafted by each fantasy team, per league';
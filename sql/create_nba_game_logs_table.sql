@@ -0,0 +1,118 @@
+-- Create NBA game log tables for Neon database
+-- nba_game_logs stores one box score line per player per game
+-- nba_player_rolling holds rolling 7/14/30-day totals per player, maintained
+-- incrementally by scripts/import_game_logs.py (add the new day, subtract the
+-- day that falls out of the window) so updates never re-scan history
+
+CREATE TABLE IF NOT EXISTS nba_game_logs (
+    player_id VARCHAR(20) NOT NULL, -- Same ids as nba_stats.player_id
+    game_date DATE NOT NULL,
+    player VARCHAR(100) NOT NULL,
+    team VARCHAR(10),
+    opponent VARCHAR(10),
+
+    minutes DECIMAL(5,1),
+    fg_made INTEGER,
+    fg_attempted INTEGER,
+    x3p_made INTEGER,
+    x3p_attempted INTEGER,
+    ft_made INTEGER,
+    ft_attempted INTEGER,
+    total_rebounds INTEGER,
+    assists INTEGER,
+    steals INTEGER,
+    blocks INTEGER,
+    turnovers INTEGER,
+    points INTEGER,
+    fpts DECIMAL(6,2),
+
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    PRIMARY KEY (player_id, game_date)
+);
+
+-- Rolling updates read exactly one day at a time
+CREATE INDEX IF NOT EXISTS idx_nba_game_logs_game_date ON nba_game_logs(game_date);
+
+CREATE TABLE IF NOT EXISTS nba_player_rolling (
+    player_id VARCHAR(20) NOT NULL,
+    window_days INTEGER NOT NULL, -- 7, 14 or 30
+    player VARCHAR(100),
+
+    -- Totals over game dates in (as_of_date - window_days, as_of_date]
+    games INTEGER NOT NULL DEFAULT 0,
+    minutes DECIMAL(8,1) NOT NULL DEFAULT 0,
+    fg_made INTEGER NOT NULL DEFAULT 0,
+    fg_attempted INTEGER NOT NULL DEFAULT 0,
+    x3p_made INTEGER NOT NULL DEFAULT 0,
+    x3p_attempted INTEGER NOT NULL DEFAULT 0,
+    ft_made INTEGER NOT NULL DEFAULT 0,
+    ft_attempted INTEGER NOT NULL DEFAULT 0,
+    total_rebounds INTEGER NOT NULL DEFAULT 0,
+    assists INTEGER NOT NULL DEFAULT 0,
+    steals INTEGER NOT NULL DEFAULT 0,
+    blocks INTEGER NOT NULL DEFAULT 0,
+    turnovers INTEGER NOT NULL DEFAULT 0,
+    points INTEGER NOT NULL DEFAULT 0,
+    fpts DECIMAL(10,2) NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (window_days, player_id)
+);
+
+-- Last game date applied to nba_player_rolling (single row)
+CREATE TABLE IF NOT EXISTS nba_player_rolling_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    as_of_date DATE NOT NULL
+);
+
+-- Per-game averages over each window, e.g. "who is hot over the last 14 days"
+CREATE OR REPLACE VIEW nba_player_rolling_averages AS
+SELECT
+    r.player_id,
+    r.player,
+    r.window_days,
+    s.as_of_date,
+    r.games,
+    ROUND(r.minutes / r.games, 1) AS minutes,
+    ROUND(r.points::numeric / r.games, 1) AS points,
+    ROUND(r.total_rebounds::numeric / r.games, 1) AS rebounds,
+    ROUND(r.assists::numeric / r.games, 1) AS assists,
+    ROUND(r.steals::numeric / r.games, 1) AS steals,
+    ROUND(r.blocks::numeric / r.games, 1) AS blocks,
+    ROUND(r.turnovers::numeric / r.games, 1) AS turnovers,
+    ROUND(r.x3p_made::numeric / r.games, 1) AS threes,
+    ROUND(r.fg_made::numeric / NULLIF(r.fg_attempted, 0), 3) AS fg_percentage,
+    ROUND(r.ft_made::numeric / NULLIF(r.ft_attempted, 0), 3) AS ft_percentage,
+    ROUND(r.fpts / r.games, 2) AS fpts
+FROM nba_player_rolling r
+CROSS JOIN nba_player_rolling_state s
+WHERE r.games > 0;
+
+-- Bump data_versions on imports so cached query results are invalidated
+-- (no-op until sql/create_data_versions_table.sql has been applied)
+DO $$
+BEGIN
+    IF to_regprocedure('bump_data_version()') IS NOT NULL THEN
+        DROP TRIGGER IF EXISTS nba_game_logs_data_version ON nba_game_logs;
+        CREATE TRIGGER nba_game_logs_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON nba_game_logs
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION bump_data_version();
+
+        DROP TRIGGER IF EXISTS nba_player_rolling_data_version ON nba_player_rolling;
+        CREATE TRIGGER nba_player_rolling_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON nba_player_rolling
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION bump_data_version();
+
+        DROP TRIGGER IF EXISTS nba_player_rolling_state_data_version ON nba_player_rolling_state;
+        CREATE TRIGGER nba_player_rolling_state_data_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON nba_player_rolling_state
+            FOR EACH STATEMENT
+            EXECUTE FUNCTION bump_data_version();
+    END IF;
+END $$;
+
+COMMENT ON TABLE nba_game_logs IS 'Per-game box score lines per player';
+COMMENT ON TABLE nba_player_rolling IS 'Rolling 7/14/30-day totals per player, maintained incrementally';
+COMMENT ON VIEW nba_player_rolling_averages IS 'Per-game averages over rolling windows ending at nba_player_rolling_state.as_of_date';
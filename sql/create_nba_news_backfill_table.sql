@@ -0,0 +1,15 @@
+-- Create NBA news backfill checkpoints for Neon database
+-- One row per backfill source (archive file or ESPN feed range). fetch_nba_news.py
+-- --backfill advances the row in the same transaction as each batch of articles,
+-- so a stopped backfill resumes exactly after the last committed batch
+
+CREATE TABLE IF NOT EXISTS nba_news_backfill_checkpoints (
+    name VARCHAR(500) PRIMARY KEY, -- e.g. 'archive:/data/espn_news_2024.jsonl' or 'espn_news:2024-10-22'
+    position BIGINT NOT NULL DEFAULT 0, -- Byte offset into the archive, or next feed page
+    items_seen INTEGER NOT NULL DEFAULT 0,
+    items_saved INTEGER NOT NULL DEFAULT 0,
+    completed BOOLEAN NOT NULL DEFAULT FALSE,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE nba_news_backfill_checkpoints IS 'Resume positions of historical news backfills';
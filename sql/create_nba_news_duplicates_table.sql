@@ -0,0 +1,21 @@
+-- Create NBA news duplicates table for Neon database
+-- Links near-duplicate articles (same story from another source, or re-published
+-- with a new timestamp) to the canonical nba_news row instead of storing them again
+
+CREATE TABLE IF NOT EXISTS nba_news_duplicates (
+    id SERIAL PRIMARY KEY,
+    canonical_id INTEGER NOT NULL REFERENCES nba_news(id) ON DELETE CASCADE,
+
+    -- The duplicate article as fetched
+    title VARCHAR(500) NOT NULL,
+    source VARCHAR(100) NOT NULL,
+    source_url TEXT,
+    published_at TIMESTAMP NOT NULL,
+
+    similarity DECIMAL(4,3), -- Estimated Jaccard similarity to the canonical article
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_nba_news_duplicates_unique ON nba_news_duplicates(canonical_id, title, published_at);
+
+COMMENT ON TABLE nba_news_duplicates IS 'Near-duplicate articles linked to their canonical nba_news row';
@@ -0,0 +1,56 @@
+-- Create NBA news embeddings table for Neon database
+-- Stores one embedding per nba_news row and model for semantic retrieval (see scripts/embed_nba_news.py)
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+CREATE TABLE IF NOT EXISTS nba_news_embeddings (
+    news_id INTEGER NOT NULL REFERENCES nba_news(id) ON DELETE CASCADE,
+
+    -- md5 of the embedded text, used to skip rows whose content has not changed
+    content_hash CHAR(32) NOT NULL,
+
+    -- Embedding backend that produced the vector, e.g. 'text-embedding-ada-002'
+    model VARCHAR(100) NOT NULL,
+
+    -- Same dimensions as the embeddings table used by the chat app
+    embedding vector(1536) NOT NULL,
+
+    embedded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    -- Each backend keeps its own vectors, so embedding with one never overwrites another's
+    PRIMARY KEY (news_id, model)
+);
+
+-- Tables created with news_id as the only key column move to (news_id, model)
+DO $$
+DECLARE
+    pkey_name TEXT;
+BEGIN
+    SELECT conname INTO pkey_name
+    FROM pg_constraint
+    WHERE conrelid = 'nba_news_embeddings'::regclass AND contype = 'p' AND cardinality(conkey) = 1;
+
+    IF pkey_name IS NOT NULL THEN
+        EXECUTE format('ALTER TABLE nba_news_embeddings DROP CONSTRAINT %I, ADD PRIMARY KEY (news_id, model)', pkey_name);
+    END IF;
+END $$;
+
+-- Approximate nearest-neighbour indexes for cosine distance (<=>), one per model.
+-- Searches filter on model, and a filter applied after a shared HNSW scan can
+-- return fewer than k rows once ef_search candidates run out, so each model
+-- gets its own partial index. embed_nba_news.py creates the index for any
+-- other model the first time it embeds with it.
+DROP INDEX IF EXISTS idx_nba_news_embeddings_hnsw;
+
+CREATE INDEX IF NOT EXISTS idx_nba_news_embeddings_hnsw_text_embedding_ada_002
+    ON nba_news_embeddings USING hnsw (embedding vector_cosine_ops)
+    WHERE model = 'text-embedding-ada-002';
+
+CREATE INDEX IF NOT EXISTS idx_nba_news_embeddings_hnsw_local_hashing_v1
+    ON nba_news_embeddings USING hnsw (embedding vector_cosine_ops)
+    WHERE model = 'local-hashing-v1';
+
+CREATE INDEX IF NOT EXISTS idx_nba_news_embeddings_model ON nba_news_embeddings(model);
+
+COMMENT ON TABLE nba_news_embeddings IS 'Vector embeddings of nba_news rows for semantic retrieval';
+COMMENT ON COLUMN nba_news_embeddings.content_hash IS 'md5 of the embedded text; rows are re-embedded only when it changes';
@@ -69,6 +69,7 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+DROP TRIGGER IF EXISTS update_nba_news_updated_at ON nba_news;
 CREATE TRIGGER update_nba_news_updated_at 
     BEFORE UPDATE ON nba_news 
     FOR EACH ROW 
@@ -78,6 +78,7 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+DROP TRIGGER IF EXISTS update_nba_stats_updated_at ON nba_stats;
 CREATE TRIGGER update_nba_stats_updated_at 
     BEFORE UPDATE ON nba_stats 
     FOR EACH ROW 
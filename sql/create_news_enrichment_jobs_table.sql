@@ -0,0 +1,43 @@
+-- Create NBA news enrichment job queue for Neon database
+-- fetch_nba_news.py --enqueue stores raw articles here instead of enriching them
+-- inline; news_enrichment_worker.py processes claim jobs with
+-- SELECT ... FOR UPDATE SKIP LOCKED, enrich them and write nba_news.
+--
+-- Job lifecycle:
+--   pending -> running (claimed; the claim expires at available_at, the visibility timeout)
+--   running -> done    (nba_news row written in the same transaction)
+--   running -> pending (failed, retried after a backoff) or dead (out of attempts)
+--   running past its visibility timeout (worker crashed) is claimed again
+
+CREATE TABLE IF NOT EXISTS news_enrichment_jobs (
+    id BIGSERIAL PRIMARY KEY,
+
+    -- The raw article, as a NewsItem
+    title VARCHAR(500) NOT NULL,
+    published_at TIMESTAMP NOT NULL,
+    payload JSONB NOT NULL,
+
+    status VARCHAR(20) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'done', 'dead')),
+    attempts INTEGER NOT NULL DEFAULT 0, -- Incremented on every claim
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    available_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP, -- When the job may next be claimed
+    locked_by VARCHAR(100), -- Worker holding the current claim
+    locked_at TIMESTAMP,
+    last_error TEXT,
+
+    news_id INTEGER REFERENCES nba_news(id) ON DELETE SET NULL, -- Result row once done
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP
+);
+
+-- Enqueueing the same article twice is a no-op
+CREATE UNIQUE INDEX IF NOT EXISTS idx_news_enrichment_jobs_article ON news_enrichment_jobs(title, published_at);
+
+-- Claims only look at unfinished jobs, oldest due first
+CREATE INDEX IF NOT EXISTS idx_news_enrichment_jobs_due
+    ON news_enrichment_jobs(available_at, id)
+    WHERE status IN ('pending', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_news_enrichment_jobs_status ON news_enrichment_jobs(status);
+
+COMMENT ON TABLE news_enrichment_jobs IS 'Durable queue of raw news articles awaiting AI enrichment';
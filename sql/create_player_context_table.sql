@@ -0,0 +1,24 @@
+-- Create player context table for Neon database
+-- Stores one precomputed JSON snapshot per player (season line, fantasy rank,
+-- current injury status and latest news) so the chat bot can answer player
+-- questions with a single primary-key lookup (see scripts/build_player_context.py)
+
+CREATE TABLE IF NOT EXISTS player_context (
+    player_id VARCHAR(20) PRIMARY KEY, -- nba_stats.player_id
+    player VARCHAR(100) NOT NULL,
+    player_key VARCHAR(100) NOT NULL, -- Lowercased, unaccented name for lookups
+
+    context JSONB NOT NULL,
+
+    -- Change markers of the inputs the snapshot was built from
+    stats_hash CHAR(32) NOT NULL,
+    news_marker TIMESTAMP,
+    injury_marker TIMESTAMP,
+
+    built_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_player_context_player_key ON player_context(player_key);
+
+COMMENT ON TABLE player_context IS 'Precomputed per-player context snapshot for the chat bot, rebuilt only when inputs change';
+COMMENT ON COLUMN player_context.context IS 'JSON with season line, fantasy rank, injury status and latest three news summaries';
@@ -0,0 +1,100 @@
+-- Create player injury status tables for Neon database
+-- player_injury_status holds the current injury state of each player (one row per player)
+-- player_injury_status_history records every change to that state
+
+CREATE TABLE IF NOT EXISTS player_injury_status (
+    player_id VARCHAR(20) PRIMARY KEY,
+
+    -- Player Information
+    player_name VARCHAR(100) NOT NULL,
+    team VARCHAR(10),
+
+    -- Current State (changes to these columns are tracked)
+    status VARCHAR(50), -- 'out', 'day-to-day', 'questionable', etc. as reported by ESPN
+    expected_return_date DATE,
+    detail TEXT, -- Injury type, location and detail, e.g. 'Knee, Left, Sprain'
+
+    -- Derived Information
+    severity VARCHAR(20), -- 'minor', 'moderate', 'severe', 'season_ending'
+    impact_level VARCHAR(20), -- 'low', 'medium', 'high', 'critical'
+    comment TEXT, -- Latest short comment from the source
+    fantasy_impact_note TEXT,
+
+    -- Source Information
+    source VARCHAR(100) NOT NULL,
+    source_url TEXT,
+    reported_at TIMESTAMP, -- Publish time of the report that caused the last change
+
+    -- Timestamps
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_player_injury_status_player_name ON player_injury_status(player_name);
+CREATE INDEX IF NOT EXISTS idx_player_injury_status_team ON player_injury_status(team);
+CREATE INDEX IF NOT EXISTS idx_player_injury_status_status ON player_injury_status(status);
+
+CREATE TABLE IF NOT EXISTS player_injury_status_history (
+    id BIGSERIAL PRIMARY KEY,
+    player_id VARCHAR(20) NOT NULL,
+    old_status VARCHAR(50),
+    new_status VARCHAR(50),
+    old_expected_return_date DATE,
+    new_expected_return_date DATE,
+    old_detail TEXT,
+    new_detail TEXT,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_player_injury_status_history_player ON player_injury_status_history(player_id, changed_at DESC);
+
+-- Record every transition in the history table and announce it on the
+-- 'player_injury_status' channel so consumers can LISTEN instead of polling
+CREATE OR REPLACE FUNCTION record_player_injury_status_change()
+RETURNS TRIGGER AS $$
+DECLARE
+    old_status VARCHAR(50);
+    old_return DATE;
+    old_detail TEXT;
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        old_status := OLD.status;
+        old_return := OLD.expected_return_date;
+        old_detail := OLD.detail;
+    END IF;
+
+    INSERT INTO player_injury_status_history (
+        player_id, old_status, new_status,
+        old_expected_return_date, new_expected_return_date,
+        old_detail, new_detail, changed_at
+    ) VALUES (
+        NEW.player_id, old_status, NEW.status,
+        old_return, NEW.expected_return_date,
+        old_detail, NEW.detail, NEW.changed_at
+    );
+
+    PERFORM pg_notify('player_injury_status', json_build_object(
+        'player_id', NEW.player_id,
+        'player_name', NEW.player_name,
+        'team', NEW.team,
+        'old_status', old_status,
+        'new_status', NEW.status,
+        'expected_return_date', NEW.expected_return_date,
+        'detail', NEW.detail,
+        'changed_at', NEW.changed_at
+    )::text);
+
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS player_injury_status_change ON player_injury_status;
+CREATE TRIGGER player_injury_status_change
+    AFTER INSERT OR UPDATE ON player_injury_status
+    FOR EACH ROW
+    EXECUTE FUNCTION record_player_injury_status_change();
+
+-- Add comments for documentation
+COMMENT ON TABLE player_injury_status IS 'Current injury state per player, only updated when status, return date or detail change';
+COMMENT ON TABLE player_injury_status_history IS 'Append-only log of player injury state transitions';
+COMMENT ON COLUMN player_injury_status.detail IS 'Injury type, location and detail joined into a single string';